@@ -1,7 +1,13 @@
 import os
 from flask import Flask
+from config import Config
+from commands import posts_cli
+from services import ActivePostIndex, GroupCommitter, PostIndexRefresher, SQLProfiler, UsersClient, \
+    VersionMarkers, build_cache, init_compression, init_metrics, pool_options, register_group_commit_metrics, \
+    register_pool_metrics, register_state_metrics
 from views import BlueprintHealth, BlueprintPost, BlueprintReset
-from db import db
+from views.post import insert_posts
+from db import REPLICA_BIND, db, init_schema
 
 DB_USER = os.getenv('DB_USER')
 DB_PASSWORD = os.getenv('DB_PASSWORD')
@@ -10,15 +16,85 @@ DB_PORT = os.getenv('DB_PORT')
 DB_NAME = os.getenv('DB_NAME')
 
 
-def create_app(database=None):
+def gevent_patched():
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched('socket')
+
+
+def create_app(database=None, config=None):
     app = Flask(__name__)
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config.from_object(Config)
     app.config['SQLALCHEMY_DATABASE_URI'] = database or \
       f'postgresql+pg8000://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
+    app.config.update(config or {})
+
+    # Opciones del pool para el primario y, si está configurada, la réplica de lectura
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        **pool_options(app.config['SQLALCHEMY_DATABASE_URI'], app.config),
+        **app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}),
+    }
+    if app.config['DB_REPLICA_URI']:
+        replica_uri = app.config['DB_REPLICA_URI']
+        app.config['SQLALCHEMY_BINDS'] = {
+            **app.config.get('SQLALCHEMY_BINDS', {}),
+            REPLICA_BIND: {'url': replica_uri, **pool_options(replica_uri, app.config)},
+        }
+
+    if app.config['ASYNC_MODE'] == 'gevent' and not gevent_patched():
+        app.logger.warning('ASYNC_MODE=gevent requiere ejecutar la aplicación con workers de gevent '
+                           '(gunicorn -k gevent); se atenderá una solicitud a la vez.')
 
     db.init_app(app)
-    with app.app_context():
-        db.create_all()
+    if app.config['DB_CREATE_ALL']:
+        # Una consulta del esquema por worker al arrancar; en producción se puede desactivar
+        # y crear el esquema una sola vez con `flask posts init-db`
+        with app.app_context():
+            init_schema()
+
+    app.extensions['token_cache'] = build_cache(
+        app.config['CACHE_URL'], maxsize=app.config['TOKEN_CACHE_SIZE'], prefix='token:')
+    app.extensions['post_cache'] = build_cache(
+        app.config['CACHE_URL'], maxsize=app.config['POST_CACHE_SIZE'], prefix='post:')
+    app.extensions['version_markers'] = VersionMarkers(
+        build_cache(app.config['CACHE_URL'], maxsize=app.config['ETAG_VERSION_CACHE_SIZE'], prefix='version:'),
+        ttl=app.config['ETAG_VERSION_TTL'])
+    app.extensions['users_client'] = UsersClient.from_config(app.config)
+
+    if app.config['POST_INDEX_ENABLED']:
+        index = ActivePostIndex(max_entries=app.config['POST_INDEX_MAX_ENTRIES'],
+                                refresh_interval=app.config['POST_INDEX_REFRESH'])
+        with app.app_context():
+            index.load(db.session)
+        app.extensions['post_index'] = index
+        app.extensions['post_index_refresher'] = PostIndexRefresher(app, index, lambda: index.load(db.session))
+
+    if app.config['METRICS_ENABLED']:
+        with app.app_context():
+            registry = init_metrics(app, db.engines.values())
+            register_pool_metrics(registry, {name or 'primary': engine for name, engine in db.engines.items()})
+        register_state_metrics(registry, app.extensions)
+
+    if app.config['SQL_PROFILER_ENABLED']:
+        profiler = SQLProfiler(app, slow_ms=app.config['SQL_SLOW_MS'], explain=app.config['SQL_EXPLAIN'])
+        with app.app_context():
+            profiler.init_app(app, db.engines.values())
+        app.extensions['sql_profiler'] = profiler
+
+    if app.config['GROUP_COMMIT_ENABLED']:
+        committer = GroupCommitter(insert_posts, max_rows=app.config['GROUP_COMMIT_MAX_ROWS'],
+                                   max_wait=app.config['GROUP_COMMIT_MAX_WAIT_MS'] / 1000)
+        if app.config['METRICS_ENABLED']:
+            register_group_commit_metrics(registry, committer)
+        app.extensions['group_commit'] = committer
+
+    # Después de init_metrics: los after_request se ejecutan en orden inverso y la compresión queda medida
+    if app.config['GZIP_MIN_SIZE'] > 0:
+        init_compression(app, app.config['GZIP_MIN_SIZE'], app.config['GZIP_LEVEL'])
+
+    app.cli.add_command(posts_cli)
 
     app.register_blueprint(BlueprintHealth, url_prefix='/posts')
     app.register_blueprint(BlueprintPost)
@@ -0,0 +1,62 @@
+"""
+Tiempo de CPU por solicitud de la preparación y validación de POST /posts: el camino anterior
+(dateutil, conversión a cadena ISO y un esquema nuevo por solicitud) frente al actual.
+
+Uso:
+    python -m benchmarks.bench_create_validation --iterations 20000
+"""
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from dateutil import parser
+from views.post import prepare_post
+from views.schemas.post_schemas import CreatePostSchema, create_post_schema
+
+
+def previous_path(payload, user_id):
+    created_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    expire_at = parser.parse(payload.get('expireAt'))
+    expire_at = expire_at.replace(tzinfo=timezone.utc)
+    expire_at = expire_at.replace(microsecond=0).isoformat()
+    return CreatePostSchema().load({
+        'routeId': payload.get('routeId'),
+        'userId': user_id,
+        'expireAt': expire_at,
+        'createdAt': created_at
+    })
+
+
+def current_path(payload, user_id):
+    created_at = datetime.now(timezone.utc).replace(microsecond=0)
+    return create_post_schema.load(prepare_post(payload, user_id, created_at))
+
+
+def measure(path, payload, user_id, iterations):
+    start = time.process_time()
+    for _ in range(iterations):
+        path(payload, user_id)
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--iterations', type=int, default=20000)
+    args = arg_parser.parse_args()
+
+    user_id = str(uuid.uuid4())
+    payload = {
+        'routeId': str(uuid.uuid4()),
+        'expireAt': (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+    }
+    assert previous_path(payload, user_id)['expireAt'] == current_path(payload, user_id)['expireAt']
+
+    previous = measure(previous_path, payload, user_id, args.iterations)
+    current = measure(current_path, payload, user_id, args.iterations)
+    print(f'anterior: {previous:.1f} µs/solicitud')
+    print(f'actual:   {current:.1f} µs/solicitud')
+    print(f'ahorro:   {previous - current:.1f} µs/solicitud ({previous / current:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Bytes enviados y tiempo de CPU de codificación de un listado de GET /posts en cada formato de
+respuesta: JSON, JSON con gzip, MessagePack (si msgpack está instalado) y MessagePack con gzip.
+
+Uso:
+    python -m benchmarks.bench_encoding --sizes 10 100 1000 10000 --level 1
+"""
+import argparse
+import gzip
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from views.encoders import msgpack_module
+from views.serializers import serialize_post
+
+
+def build_rows(size):
+    now = datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
+    return [(str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4()), now + timedelta(days=1), now)
+            for _ in range(size)]
+
+
+def formats(level):
+    json_provider = DefaultJSONProvider(Flask(__name__))
+    encoders = {
+        'json': lambda data: json_provider.dumps(data).encode(),
+        'json+gzip': lambda data: gzip.compress(json_provider.dumps(data).encode(), compresslevel=level),
+    }
+    msgpack = msgpack_module()
+    if msgpack is not None:
+        encoders['msgpack'] = msgpack.packb
+        encoders['msgpack+gzip'] = lambda data: gzip.compress(msgpack.packb(data), compresslevel=level)
+    return encoders
+
+
+def measure(encode, rows, iterations):
+    start = time.process_time()
+    for _ in range(iterations):
+        body = encode([serialize_post(row) for row in rows])
+    return len(body), (time.process_time() - start) / iterations * 1e6
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    arg_parser.add_argument('--level', type=int, default=1, help='Nivel de compresión de gzip')
+    arg_parser.add_argument('--min-time', type=float, default=0.2, help='Segundos mínimos por medición')
+    args = arg_parser.parse_args()
+
+    encoders = formats(args.level)
+    if 'msgpack' not in encoders:
+        print('msgpack no está instalado: solo se mide JSON')
+
+    print(f'{"filas":>7} {"formato":<13} {"bytes":>10} {"µs/respuesta":>13}')
+    for size in args.sizes:
+        rows = build_rows(size)
+        for name, encode in encoders.items():
+            _, elapsed = measure(encode, rows, 1)
+            iterations = max(1, int(args.min_time / max(elapsed / 1e6, 1e-6)))
+            size_bytes, elapsed = measure(encode, rows, iterations)
+            print(f'{size:>7} {name:<13} {size_bytes:>10} {elapsed:>13.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Filas por segundo al leer y serializar publicaciones con objetos del ORM frente a la proyección
+de columnas con select(*POST_COLUMNS) y serialize_post.
+
+Uso:
+    python -m benchmarks.bench_projection --sizes 10000 50000 100000
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert, select
+from app import create_app
+from db import db
+from models import Post
+from views.serializers import POST_COLUMNS, serialize_post
+
+
+def seed(size):
+    db.session.query(Post).delete()
+    now = datetime.now(timezone.utc)
+    rows = [{
+        'id': str(uuid.uuid4()),
+        'routeId': str(uuid.uuid4()),
+        'userId': str(uuid.uuid4()),
+        'expireAt': now + timedelta(hours=random.randint(-48, 48)),
+        'createdAt': now - timedelta(hours=random.randint(0, 48)),
+    } for _ in range(size)]
+    for start in range(0, size, 5000):
+        db.session.execute(insert(Post), rows[start:start + 5000])
+    db.session.commit()
+
+
+def orm_path():
+    # Camino anterior: objetos del ORM y diccionario construido por atributo
+    results = [{
+        "id": post.id,
+        "routeId": post.routeId,
+        "userId": post.userId,
+        "expireAt": post.expireAt.isoformat(),
+        "createdAt": post.createdAt.isoformat()
+    } for post in Post.query.all()]
+    return json.dumps(results)
+
+
+def projection_path():
+    rows = db.session.execute(select(*POST_COLUMNS)).all()
+    return json.dumps([serialize_post(row) for row in rows])
+
+
+def measure(path, size, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        path()
+        samples.append(time.perf_counter() - start)
+        db.session.expunge_all()
+    return size / statistics.median(samples)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--database', help='URI de la base de datos (por defecto un SQLite temporal)')
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 50000, 100000])
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    path = None
+    database = args.database
+    if not database:
+        fd, path = tempfile.mkstemp(suffix='.sqlite')
+        os.close(fd)
+        database = f'sqlite:///{path}'
+
+    app = create_app(database=database)
+    print(f'{"filas":>8} {"ORM (filas/s)":>15} {"proyección (filas/s)":>21} {"mejora":>7}')
+
+    try:
+        with app.app_context():
+            for size in args.sizes:
+                seed(size)
+                orm = measure(orm_path, size, args.repeat)
+                projection = measure(projection_path, size, args.repeat)
+                print(f'{size:>8} {orm:>15,.0f} {projection:>21,.0f} {projection / orm:>6.2f}x')
+            db.session.query(Post).delete()
+            db.session.commit()
+            db.engine.dispose()
+    finally:
+        if path:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
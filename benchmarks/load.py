@@ -0,0 +1,228 @@
+"""
+Pruebas de carga reproducibles de la API de publicaciones.
+
+Levanta create_app con un servicio de usuarios simulado y una base de datos sembrada (SQLite, y
+Postgres si se indica con --postgres o BENCH_POSTGRES_URI), recorre todos los endpoints con la
+concurrencia y los tamaños de datos indicados y reporta p50/p95/p99 y solicitudes por segundo.
+Los resultados se guardan en JSON para comparar ejecuciones y detectar regresiones.
+
+Uso:
+    python -m benchmarks.load --sizes 1000 10000 --concurrency 1 8 --requests 300 --output bench.json
+    python -m benchmarks.load --baseline bench.json --threshold 0.15
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import requests
+from sqlalchemy import insert
+from werkzeug.serving import make_server
+from app import create_app
+from db import db
+from models import Post
+from tests.users_stub import UsersStub
+
+TOKEN = 'Bearer bench'
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class Target:
+    """
+    Instancia de la aplicación servida en un hilo, con su base de datos sembrada.
+    """
+
+    def __init__(self, database, users_url, size):
+        self.app = create_app(database=database, config={'USERS_PATH': users_url})
+        self.size = size
+        self.routes = [str(uuid.uuid4()) for _ in range(max(1, size // 100))]
+        self.owner = str(uuid.uuid4())
+        self.ids = []
+        self._server = make_server('127.0.0.1', 0, self.app, threaded=True)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self._server.server_port}'
+
+    def __enter__(self):
+        self.seed()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        with self.app.app_context():
+            db.session.query(Post).delete()
+            db.session.commit()
+            db.engine.dispose()
+
+    def seed(self):
+        now = datetime.now(timezone.utc)
+        users = [self.owner] + [str(uuid.uuid4()) for _ in range(max(1, self.size // 50))]
+        rows = [{
+            'id': str(uuid.uuid4()),
+            'routeId': random.choice(self.routes),
+            'userId': random.choice(users),
+            'expireAt': now + timedelta(hours=random.randint(-48, 48)),
+            'createdAt': now - timedelta(hours=random.randint(0, 48)),
+        } for _ in range(self.size)]
+        self.ids = [row['id'] for row in rows]
+        with self.app.app_context():
+            db.session.query(Post).delete()
+            for start in range(0, len(rows), 5000):
+                db.session.execute(insert(Post), rows[start:start + 5000])
+            db.session.commit()
+
+
+def scenarios(target):
+    """
+    Escenarios de carga: nombre y función que construye la solicitud número i.
+    """
+    route = target.routes[0]
+    expire_at = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+    ids = list(target.ids)
+    random.shuffle(ids)
+    deletable = iter(ids[len(ids) // 2:])
+    readable = ids[:len(ids) // 2]
+
+    return [
+        ('ping', lambda i: ('GET', '/posts/ping', None)),
+        ('create', lambda i: ('POST', '/posts', {'routeId': route, 'expireAt': expire_at})),
+        ('list', lambda i: ('GET', '/posts', None)),
+        ('list route', lambda i: ('GET', f'/posts?route={route}', None)),
+        ('list owner', lambda i: ('GET', '/posts?owner=me', None)),
+        ('list expired', lambda i: ('GET', '/posts?expire=true', None)),
+        ('list active', lambda i: ('GET', '/posts?expire=false', None)),
+        ('list route active', lambda i: ('GET', f'/posts?route={route}&expire=false', None)),
+        ('list owner expired', lambda i: ('GET', '/posts?owner=me&expire=true', None)),
+        ('get', lambda i: ('GET', f'/posts/{readable[i % len(readable)]}', None)),
+        ('delete', lambda i: ('DELETE', f'/posts/{next(deletable, uuid.uuid4())}', None)),
+    ]
+
+
+def run_scenario(url, build, total, concurrency):
+    local = threading.local()
+
+    def call(i):
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+        method, path, body = build(i)
+        start = time.perf_counter()
+        response = local.session.request(method, url + path, json=body, headers={'Authorization': TOKEN})
+        response.content
+        return time.perf_counter() - start, response.status_code < 500
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        samples = list(executor.map(call, range(total)))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for latency, _ in samples]
+    return {
+        'requests': total,
+        'errors': sum(1 for _, ok in samples if not ok),
+        'rps': round(total / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+def run(backends, sizes, concurrencies, total):
+    results = []
+    with UsersStub() as stub:
+        for backend, database in backends:
+            for size in sizes:
+                for concurrency in concurrencies:
+                    with Target(database, stub.url, size) as target:
+                        stub.users[TOKEN] = target.owner
+                        for name, build in scenarios(target):
+                            result = run_scenario(target.url, build, total, concurrency)
+                            result.update(backend=backend, size=size, concurrency=concurrency, scenario=name)
+                            results.append(result)
+                            print(f'{backend:<9} {size:>7} {concurrency:>4} {name:<19} {result["rps"]:>9.1f} '
+                                  f'{result["p50_ms"]:>9.2f} {result["p95_ms"]:>9.2f} {result["p99_ms"]:>9.2f} '
+                                  f'{result["errors"]:>6}')
+
+                        reset = run_scenario(target.url, lambda i: ('POST', '/posts/reset', None), 1, 1)
+                        reset.update(backend=backend, size=size, concurrency=1, scenario='reset')
+                        results.append(reset)
+                        print(f'{backend:<9} {size:>7} {1:>4} {"reset":<19} {"":>9} {reset["p50_ms"]:>9.2f}')
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compara con una ejecución anterior. Retorna las regresiones: p95 mayor o rps menor en más de threshold.
+    """
+    key = lambda result: (result['backend'], result['size'], result['concurrency'], result['scenario'])  # noqa: E731
+    previous = {key(result): result for result in baseline['results']}
+    regressions = []
+    for result in results:
+        before = previous.get(key(result))
+        if before is None:
+            continue
+        if result['p95_ms'] > before['p95_ms'] * (1 + threshold):
+            regressions.append((key(result), 'p95_ms', before['p95_ms'], result['p95_ms']))
+        if result['requests'] > 1 and result['rps'] < before['rps'] * (1 - threshold):
+            regressions.append((key(result), 'rps', before['rps'], result['rps']))
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--postgres', default=os.getenv('BENCH_POSTGRES_URI'),
+                            help='URI de una base de datos Postgres local (opcional)')
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    arg_parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8])
+    arg_parser.add_argument('--requests', type=int, default=300, help='Solicitudes por escenario')
+    arg_parser.add_argument('--seed', type=int, default=42)
+    arg_parser.add_argument('--output', help='Archivo JSON donde guardar los resultados')
+    arg_parser.add_argument('--baseline', help='Resultados JSON de una ejecución anterior para comparar')
+    arg_parser.add_argument('--threshold', type=float, default=0.15, help='Tolerancia de regresión (0.15 = 15%%)')
+    args = arg_parser.parse_args()
+
+    random.seed(args.seed)
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    fd, path = tempfile.mkstemp(suffix='.sqlite')
+    os.close(fd)
+    backends = [('sqlite', f'sqlite:///{path}')]
+    if args.postgres:
+        backends.append(('postgres', args.postgres))
+
+    print(f'{"backend":<9} {"filas":>7} {"conc":>4} {"escenario":<19} {"req/s":>9} {"p50 ms":>9} {"p95 ms":>9} '
+          f'{"p99 ms":>9} {"errores":>6}')
+    try:
+        results = run(backends, args.sizes, args.concurrency, args.requests)
+    finally:
+        os.remove(path)
+
+    if args.output:
+        meta = {'date': datetime.now(timezone.utc).isoformat(), 'python': platform.python_version(),
+                'platform': platform.platform(), 'requests': args.requests, 'seed': args.seed}
+        with open(args.output, 'w') as output:
+            json.dump({'meta': meta, 'results': results}, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            regressions = compare(results, json.load(baseline), args.threshold)
+        for key, metric, before, after in regressions:
+            print(f'REGRESIÓN {key}: {metric} {before} -> {after}')
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
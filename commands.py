@@ -0,0 +1,70 @@
+from datetime import timedelta
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from db import db, init_schema
+from models import Post, PostArchive
+from services import InvalidUUIDValues, ReaperScheduler, migrate_uuid_columns, reap_expired_posts
+from views.invalidation import posts_deleted
+
+posts_cli = AppGroup('posts', help='Tareas de mantenimiento de las publicaciones.')
+
+
+def run_reaper(retention_hours=None, batch_size=None, max_batches=None):
+    """
+    Archiva las publicaciones expiradas según la configuración de la aplicación (o los valores dados).
+    """
+    config = current_app.config
+    if retention_hours is None:
+        retention_hours = config['REAPER_RETENTION_HOURS']
+    return reap_expired_posts(
+        db.session,
+        retention=timedelta(hours=retention_hours),
+        batch_size=batch_size or config['REAPER_BATCH_SIZE'],
+        max_batches=max_batches or config['REAPER_MAX_BATCHES'] or None,
+        on_batch=posts_deleted,
+    )
+
+
+@posts_cli.command('init-db')
+def init_db_command():
+    """
+    Crea las tablas y los índices que aún no existan (necesario si DB_CREATE_ALL=false).
+    """
+    init_schema()
+    click.echo('Esquema de la base de datos creado')
+
+
+@posts_cli.command('migrate-uuid')
+@click.option('--chunk-size', type=int, default=1000, help='Filas convertidas por transacción (SQLite).')
+def migrate_uuid_command(chunk_size):
+    """
+    Convierte a UUID nativo los identificadores guardados como texto por versiones anteriores.
+    """
+    try:
+        converted = migrate_uuid_columns(db.session, [Post, PostArchive], chunk_size)
+    except InvalidUUIDValues as e:
+        raise click.ClickException(str(e))
+    click.echo(f'{converted} filas convertidas')
+
+
+@posts_cli.command('reap')
+@click.option('--retention-hours', type=float, help='Horas después de expireAt antes de archivar una publicación.')
+@click.option('--batch-size', type=int, help='Filas movidas por transacción.')
+@click.option('--max-batches', type=int, help='Número máximo de lotes en esta ejecución.')
+@click.option('--interval', type=float, help='Repetir cada N segundos sin terminar (por defecto REAPER_INTERVAL; '
+                                             '0 = una sola ejecución).')
+def reap_command(retention_hours, batch_size, max_batches, interval):
+    """
+    Mueve las publicaciones expiradas a la tabla post_archive.
+    """
+    def run():
+        moved = run_reaper(retention_hours, batch_size, max_batches)
+        click.echo(f'{moved} publicaciones archivadas')
+        return moved
+
+    run()
+    if interval is None:
+        interval = current_app.config['REAPER_INTERVAL']
+    if interval > 0:
+        ReaperScheduler(current_app._get_current_object(), interval, run).run()
@@ -0,0 +1,101 @@
+import os
+
+
+class Config:
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Modo de ejecución: 'sync' o 'gevent' (ver gunicorn.conf.py)
+    ASYNC_MODE = os.getenv('ASYNC_MODE', 'sync')
+
+    # Caché compartida (vacío = caché en memoria de cada proceso, redis://... = compartida)
+    CACHE_URL = os.getenv('CACHE_URL')
+
+    # Caché de verificación de tokens
+    TOKEN_CACHE_SIZE = int(os.getenv('TOKEN_CACHE_SIZE', 1024))
+    TOKEN_CACHE_TTL = float(os.getenv('TOKEN_CACHE_TTL', 60))
+    TOKEN_CACHE_INVALID_TTL = float(os.getenv('TOKEN_CACHE_INVALID_TTL', 5))
+
+    # Cliente del servicio de usuarios
+    USERS_PATH = os.getenv('USERS_PATH')
+    USERS_POOL_SIZE = int(os.getenv('USERS_POOL_SIZE', 10))
+    USERS_CONNECT_TIMEOUT = float(os.getenv('USERS_CONNECT_TIMEOUT', 2))
+    USERS_READ_TIMEOUT = float(os.getenv('USERS_READ_TIMEOUT', 5))
+    USERS_RETRIES = int(os.getenv('USERS_RETRIES', 2))
+    USERS_BREAKER_THRESHOLD = int(os.getenv('USERS_BREAKER_THRESHOLD', 5))
+    USERS_BREAKER_RESET = float(os.getenv('USERS_BREAKER_RESET', 30))
+
+    # Paginación de GET /posts
+    POSTS_PAGE_SIZE = int(os.getenv('POSTS_PAGE_SIZE', 50))
+    POSTS_PAGE_MAX = int(os.getenv('POSTS_PAGE_MAX', 200))
+
+    # Filas leídas y enviadas por bloque en las respuestas de GET /posts por streaming
+    STREAM_CHUNK_SIZE = int(os.getenv('STREAM_CHUNK_SIZE', 500))
+
+    # Número máximo de publicaciones por solicitud de POST /posts/batch
+    POSTS_BATCH_MAX = int(os.getenv('POSTS_BATCH_MAX', 100))
+
+    # Caché de GET /posts/<id>; por defecto solo con CACHE_URL, porque con una caché por proceso las
+    # eliminaciones no se ven en los demás workers hasta que vence POST_CACHE_TTL
+    POST_CACHE_SIZE = int(os.getenv('POST_CACHE_SIZE', 4096 if CACHE_URL else 0))
+    POST_CACHE_TTL = float(os.getenv('POST_CACHE_TTL', 300))
+    POST_CACHE_MISS_TTL = float(os.getenv('POST_CACHE_MISS_TTL', 5))
+
+    # Índice en memoria de publicaciones no expiradas por ruta y dueño
+    POST_INDEX_ENABLED = os.getenv('POST_INDEX_ENABLED', 'false').lower() == 'true'
+    POST_INDEX_MAX_ENTRIES = int(os.getenv('POST_INDEX_MAX_ENTRIES', 100000))
+    POST_INDEX_REFRESH = float(os.getenv('POST_INDEX_REFRESH', 60))
+
+    # Archivo de publicaciones expiradas (flask posts reap; con REAPER_INTERVAL el comando se repite sin terminar)
+    REAPER_RETENTION_HOURS = float(os.getenv('REAPER_RETENTION_HOURS', 24))
+    REAPER_BATCH_SIZE = int(os.getenv('REAPER_BATCH_SIZE', 500))
+    REAPER_MAX_BATCHES = int(os.getenv('REAPER_MAX_BATCHES', 0))
+    REAPER_INTERVAL = float(os.getenv('REAPER_INTERVAL', 0))
+
+    # Reset de la base de datos: TRUNCATE en Postgres o eliminación por bloques
+    RESET_TRUNCATE = os.getenv('RESET_TRUNCATE', 'true').lower() == 'true'
+    RESET_CHUNK_SIZE = int(os.getenv('RESET_CHUNK_SIZE', 5000))
+
+    # Instrumentación: tiempos por fase, encabezado Server-Timing y /posts/metrics
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'false').lower() == 'true'
+
+    # Perfilador de SQL: cuenta y mide las sentencias, y registra las lentas (opcionalmente con EXPLAIN)
+    SQL_PROFILER_ENABLED = os.getenv('SQL_PROFILER_ENABLED', 'false').lower() == 'true'
+    SQL_SLOW_MS = float(os.getenv('SQL_SLOW_MS', 100))
+    SQL_EXPLAIN = os.getenv('SQL_EXPLAIN', 'false').lower() == 'true'
+
+    # Group commit: las creaciones concurrentes de un worker se guardan en una sola transacción de hasta
+    # GROUP_COMMIT_MAX_ROWS filas, esperando como máximo GROUP_COMMIT_MAX_WAIT_MS por más solicitudes
+    GROUP_COMMIT_ENABLED = os.getenv('GROUP_COMMIT_ENABLED', 'false').lower() == 'true'
+    GROUP_COMMIT_MAX_ROWS = int(os.getenv('GROUP_COMMIT_MAX_ROWS', 100))
+    GROUP_COMMIT_MAX_WAIT_MS = float(os.getenv('GROUP_COMMIT_MAX_WAIT_MS', 5))
+
+    # Filas eliminadas por transacción en DELETE /posts
+    POSTS_DELETE_BATCH = int(os.getenv('POSTS_DELETE_BATCH', 500))
+
+    # Número máximo de ids por solicitud de POST /posts/lookup y de ids por consulta IN
+    POSTS_LOOKUP_MAX = int(os.getenv('POSTS_LOOKUP_MAX', 1000))
+    POSTS_LOOKUP_CHUNK = int(os.getenv('POSTS_LOOKUP_CHUNK', 500))
+
+    # Número de grupos o intervalos de GET /posts/stats por defecto y máximo
+    STATS_LIMIT = int(os.getenv('STATS_LIMIT', 20))
+    STATS_LIMIT_MAX = int(os.getenv('STATS_LIMIT_MAX', 200))
+
+    # Marcadores de versión de los listados para los ETag de GET /posts (0 desactiva los ETag de los listados).
+    # Por defecto solo con CACHE_URL: con marcadores por proceso un worker no ve los cambios hechos en otro
+    ETAG_VERSION_CACHE_SIZE = int(os.getenv('ETAG_VERSION_CACHE_SIZE', 8192))
+    ETAG_VERSION_TTL = int(os.getenv('ETAG_VERSION_TTL', 300 if CACHE_URL else 0))
+
+    # Compresión gzip de las respuestas de al menos GZIP_MIN_SIZE bytes (0 la desactiva)
+    GZIP_MIN_SIZE = int(os.getenv('GZIP_MIN_SIZE', 1024))
+    GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', 1))
+
+    # Pool de conexiones (no aplica a SQLite) y réplica de lectura opcional para GET /posts y GET /posts/<id>
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    DB_REPLICA_URI = os.getenv('DB_REPLICA_URI')
+
+    # Crear el esquema al arrancar cada worker. Con false se crea una sola vez con `flask posts init-db`
+    DB_CREATE_ALL = os.getenv('DB_CREATE_ALL', 'true').lower() == 'true'
@@ -1,3 +1,47 @@
+from flask import g, has_request_context
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
 
-db = SQLAlchemy()
+REPLICA_BIND = 'replica'
+
+
+def reading_replica():
+    """
+    Indica si las lecturas de la solicitud actual van a la réplica: la vista lo pidió con g.db_replica
+    y hay una réplica configurada.
+    """
+    return has_request_context() and bool(g.get('db_replica')) and REPLICA_BIND in db.engines
+
+
+class RoutingSession(Session):
+    """
+    Sesión que envía las lecturas a la réplica (bind 'replica') cuando la vista lo pidió con
+    g.db_replica. Las escrituras (flush) y cualquier lectura fuera de esas vistas van al primario.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and reading_replica():
+            return self._db.engines[REPLICA_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+
+def create_indexes():
+    """
+    Crea los índices declarados en los modelos que aún no existan. create_all solo los crea
+    junto con tablas nuevas, por lo que una tabla existente no los recibiría.
+    """
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+
+
+def init_schema():
+    """
+    Crea las tablas y los índices que aún no existan. La réplica es de solo lectura: el esquema
+    se crea únicamente en el primario.
+    """
+    db.create_all(bind_key=None)
+    create_indexes()
@@ -0,0 +1,31 @@
+import os
+
+# Con ASYNC_MODE=gevent cada worker atiende muchas solicitudes concurrentes: las llamadas al servicio
+# de usuarios (requests) y a Postgres (pg8000) son Python puro y ceden el control mientras esperan I/O
+if os.getenv('ASYNC_MODE', 'sync') == 'gevent':
+    worker_class = 'gevent'
+    worker_connections = int(os.getenv('ASYNC_WORKER_CONNECTIONS', 1000))
+
+# Con PRELOAD_APP=true la aplicación se crea una vez en el master y los workers la heredan al hacer
+# fork, compartiendo su memoria (copy-on-write) en lugar de importar y crear todo en cada worker
+preload_app = os.getenv('PRELOAD_APP', 'false').lower() == 'true'
+
+if preload_app:
+    # Módulos que la aplicación importa de forma diferida: cargarlos en el master evita que cada worker los importe
+    import dateutil.parser  # noqa: F401
+    import requests  # noqa: F401
+
+
+def post_fork(server, worker):
+    """
+    Con preload_app el master pudo abrir conexiones a la base de datos al crear la aplicación. Cada worker
+    descarta el pool heredado sin cerrar esos sockets (siguen siendo del master) y abre sus propias conexiones.
+    """
+    if not server.cfg.preload_app:
+        return
+
+    from db import db
+    app = server.app.wsgi()
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
@@ -1 +1,3 @@
+from .types import UUIDString, is_valid_uuid
 from .post import Post
+from .post_archive import PostArchive
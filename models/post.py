@@ -1,12 +1,22 @@
 from db import db
 from datetime import datetime
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, mapped_column
+from .types import UUIDString
 
 
 class Post(db.Model):
-    id: Mapped[str] = mapped_column(primary_key=True)
-    routeId: Mapped[str]
-    userId: Mapped[str]
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+    routeId: Mapped[str] = mapped_column(UUIDString)
+    userId: Mapped[str] = mapped_column(UUIDString)
     expireAt: Mapped[datetime]
     createdAt: Mapped[datetime]
 
+    # Índices para las combinaciones de filtros de GET /posts (route, owner y expire)
+    __table_args__ = (
+        Index('ix_post_route_expire', 'routeId', 'expireAt'),
+        Index('ix_post_user_expire', 'userId', 'expireAt'),
+        Index('ix_post_expire', 'expireAt'),
+        # Orden de la paginación por keyset
+        Index('ix_post_created_id', 'createdAt', 'id'),
+    )
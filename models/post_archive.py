@@ -0,0 +1,24 @@
+from db import db
+from datetime import datetime
+from sqlalchemy import Index
+from sqlalchemy.orm import Mapped, mapped_column
+from .types import UUIDString
+
+
+class PostArchive(db.Model):
+    """
+    Publicaciones expiradas que el reaper retiró de la tabla post.
+    """
+    __tablename__ = 'post_archive'
+
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True)
+    routeId: Mapped[str] = mapped_column(UUIDString)
+    userId: Mapped[str] = mapped_column(UUIDString)
+    expireAt: Mapped[datetime]
+    createdAt: Mapped[datetime]
+    archivedAt: Mapped[datetime]
+
+    __table_args__ = (
+        Index('ix_post_archive_route_expire', 'routeId', 'expireAt'),
+        Index('ix_post_archive_user_expire', 'userId', 'expireAt'),
+    )
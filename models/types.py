@@ -0,0 +1,46 @@
+import re
+import uuid
+from sqlalchemy import LargeBinary
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import TypeDecorator
+
+# UUID en su forma de texto con guiones; se valida con fullmatch para no aceptar texto adicional
+UUID_PATTERN = re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+
+
+def is_valid_uuid(value):
+    """
+    Comprueba si value es un UUID válido en formato de cadena.
+    """
+    return isinstance(value, str) and UUID_PATTERN.fullmatch(value) is not None
+
+
+class UUIDString(TypeDecorator):
+    """
+    UUID guardado de forma nativa (uuid en Postgres, 16 bytes en otras bases de datos) y expuesto
+    en Python como cadena en minúsculas, igual que en las respuestas JSON.
+    """
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(value)
+        return value if dialect.name == 'postgresql' else value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        if isinstance(value, str):
+            # Filas aún no migradas por `flask posts migrate-uuid`
+            return value.lower()
+        return str(uuid.UUID(bytes=bytes(value)))
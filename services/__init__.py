@@ -0,0 +1,12 @@
+from .cache import LRUCache, RedisCache, build_cache
+from .compression import init_compression
+from .group_commit import GroupCommitter
+from .metrics import MetricsRegistry, init_metrics, phase, register_group_commit_metrics, register_pool_metrics, \
+    register_state_metrics
+from .pool import TimedQueuePool, pool_options
+from .post_index import ActivePostIndex, PostIndexRefresher
+from .reaper import ReaperScheduler, reap_expired_posts
+from .sql_profiler import SQLProfiler, count_queries
+from .users import CircuitBreaker, UsersClient, UsersServiceUnavailable
+from .uuid_migration import InvalidUUIDValues, migrate_uuid_columns
+from .versions import VersionMarkers
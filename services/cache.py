@@ -0,0 +1,120 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Caché en memoria del proceso, acotada por número de entradas, con expiración (TTL) por entrada
+    y desalojo del elemento usado menos recientemente cuando se alcanza el límite.
+    """
+
+    def __init__(self, maxsize=1024, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._timer = timer
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at <= self._timer():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl):
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (value, self._timer() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data), "maxsize": self.maxsize}
+
+
+class RedisCache:
+    """
+    Caché compartida entre procesos (por ejemplo, los workers de gunicorn) sobre Redis.
+    Los contadores de aciertos y fallos son locales a cada proceso.
+    """
+
+    def __init__(self, url, prefix='', client=None):
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        if client is None:
+            try:
+                import redis  # Solo se necesita con CACHE_URL=redis://...
+            except ImportError as e:
+                raise RuntimeError(f'CACHE_URL={url} requiere el paquete redis (pip install redis)') from e
+            client = redis.Redis.from_url(url)
+        self._client = client
+
+    def get(self, key, default=None):
+        raw = self._client.get(self.prefix + key)
+        if raw is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return pickle.loads(raw)
+
+    def set(self, key, value, ttl):
+        if ttl <= 0:
+            return
+        self._client.set(self.prefix + key, pickle.dumps(value), px=int(ttl * 1000))
+
+    def delete(self, key):
+        self._client.delete(self.prefix + key)
+
+    def clear(self):
+        keys = list(self._client.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self._client.delete(*keys)
+
+    def __len__(self):
+        return sum(1 for _ in self._client.scan_iter(match=self.prefix + '*'))
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self), "maxsize": None}
+
+
+def build_cache(url=None, maxsize=1024, prefix=''):
+    """
+    Construye la caché según la URL configurada: sin URL (o memory://) se usa la caché
+    en memoria del proceso; con redis:// se usa una caché compartida. Con maxsize <= 0 la caché
+    queda desactivada con cualquier backend.
+    """
+    if not url or url.startswith('memory://') or maxsize <= 0:
+        return LRUCache(maxsize=maxsize)
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisCache(url, prefix=prefix)
+    raise ValueError(f'Backend de caché no soportado: {url}')
@@ -0,0 +1,34 @@
+import gzip
+from flask import request
+from .metrics import phase
+
+COMPRESSIBLE_MIMETYPES = ('application/json', 'application/msgpack', 'application/x-ndjson')
+
+
+def init_compression(app, min_size, level=6):
+    """
+    Comprime con gzip las respuestas de al menos min_size bytes si el cliente acepta gzip. Las respuestas
+    por bloques (stream) se envían sin comprimir. El ETag de una respuesta comprimida pasa a ser débil,
+    porque el cuerpo enviado ya no es idéntico byte a byte al de la representación sin comprimir.
+    """
+    @app.after_request
+    def compress(response):
+        if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+            return response
+        response.vary.add('Accept-Encoding')
+
+        if (response.status_code != 200 or response.is_streamed or 'Content-Encoding' in response.headers
+                or request.accept_encodings['gzip'] <= 0):
+            return response
+
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+
+        with phase('gzip'):
+            response.set_data(gzip.compress(data, compresslevel=level))
+        response.headers['Content-Encoding'] = 'gzip'
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
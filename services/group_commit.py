@@ -0,0 +1,114 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    __slots__ = ('row', 'done', 'error')
+
+    def __init__(self, row):
+        self.row = row
+        self.done = False
+        self.error = None
+
+
+class GroupCommitter:
+    """
+    Agrupa en una sola transacción las filas que los hilos (o greenlets) de un proceso envían al mismo
+    tiempo. El primer hilo que llega sin un líder activo pasa a ser el líder: espera hasta max_wait
+    segundos o hasta reunir max_rows filas, las escribe con write(rows) y despierta a los demás, que
+    reciben el resultado de su propia fila. Si la transacción del lote falla, cada fila se reintenta
+    por separado para que un error solo afecte a la solicitud que lo causó.
+    """
+
+    def __init__(self, write, max_rows=100, max_wait=0.005, on_batch=None, timer=time.monotonic):
+        self.write = write
+        self.max_rows = max_rows
+        self.max_wait = max_wait
+        self.on_batch = on_batch
+        self._timer = timer
+        self._cond = threading.Condition()
+        self._pending = []
+        self._leading = False
+        self._batches = 0
+        self._rows = 0
+
+    def submit(self, row):
+        """
+        Escribe la fila como parte de un lote y retorna cuando su transacción terminó. Lanza la excepción
+        de la escritura si la fila no se pudo guardar.
+        """
+        entry = _Entry(row)
+        with self._cond:
+            self._pending.append(entry)
+            self._cond.notify_all()
+            while True:
+                while not entry.done and self._leading:
+                    self._cond.wait()
+                if entry.done:
+                    break
+                self._lead()
+
+        if entry.error is not None:
+            raise entry.error
+
+    def stats(self):
+        with self._cond:
+            return {"batches": self._batches, "rows": self._rows}
+
+    def _lead(self):
+        # Se ejecuta con el lock tomado; lo libera mientras escribe el lote
+        self._leading = True
+        deadline = self._timer() + self.max_wait
+        while len(self._pending) < self.max_rows:
+            remaining = deadline - self._timer()
+            if remaining <= 0:
+                break
+            self._cond.wait(remaining)
+        batch, self._pending = self._pending[:self.max_rows], self._pending[self.max_rows:]
+
+        self._cond.release()
+        try:
+            errors = self._flush([entry.row for entry in batch])
+        except Exception as e:
+            errors = [e] * len(batch)
+        else:
+            self._report(len(batch))
+        finally:
+            self._cond.acquire()
+
+        for entry, error in zip(batch, errors):
+            entry.error = error
+            entry.done = True
+        self._batches += 1
+        self._rows += len(batch)
+        self._leading = False
+        self._cond.notify_all()
+
+    def _report(self, size):
+        # Un error del callback (por ejemplo, de las métricas) no cambia el resultado de filas ya guardadas
+        if self.on_batch is None:
+            return
+        try:
+            self.on_batch(size)
+        except Exception:
+            logger.exception('Group commit: error en on_batch')
+
+    def _flush(self, rows):
+        try:
+            self.write(rows)
+            return [None] * len(rows)
+        except Exception as e:
+            if len(rows) == 1:
+                return [e]
+
+        errors = []
+        for row in rows:
+            try:
+                self.write([row])
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
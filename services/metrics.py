@@ -0,0 +1,224 @@
+import threading
+import time
+from flask import g, has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from .pool import TimedQueuePool
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class MetricsRegistry:
+    """
+    Contadores, histogramas y gauges del proceso en el formato de texto de Prometheus.
+    Cada worker de gunicorn tiene su propio registro.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name, help):
+        self._metrics[name] = ('counter', help, {})
+
+    def histogram(self, name, help, buckets=LATENCY_BUCKETS):
+        self._metrics[name] = ('histogram', help, {'buckets': buckets, 'series': {}})
+
+    def gauge(self, name, help, callback):
+        """
+        Gauge calculado al momento de exponer las métricas: callback retorna {etiquetas: valor}.
+        """
+        self._metrics[name] = ('gauge', help, callback)
+
+    def inc(self, name, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        series = self._metrics[name][2]
+        with self._lock:
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        key = tuple(sorted(labels.items()))
+        histogram = self._metrics[name][2]
+        buckets = histogram['buckets']
+        with self._lock:
+            counts = histogram['series'].get(key)
+            if counts is None:
+                counts = histogram['series'][key] = [0] * (len(buckets) + 2)
+            for position, bound in enumerate(buckets):
+                if value <= bound:
+                    counts[position] += 1
+            counts[-2] += 1
+            counts[-1] += value
+
+    def render(self):
+        lines = []
+        with self._lock:
+            for name, (kind, help, data) in self._metrics.items():
+                lines.append(f'# HELP {name} {help}')
+                lines.append(f'# TYPE {name} {kind}')
+                if kind == 'counter':
+                    for key, value in data.items():
+                        lines.append(f'{name}{_labels(key)} {value}')
+                elif kind == 'gauge':
+                    for labels, value in data().items():
+                        lines.append(f'{name}{_labels(tuple(sorted(labels)))} {value}')
+                else:
+                    for key, counts in data['series'].items():
+                        for position, bound in enumerate(data['buckets']):
+                            lines.append(f'{name}_bucket{_labels(key + (("le", bound),))} {counts[position]}')
+                        lines.append(f'{name}_bucket{_labels(key + (("le", "+Inf"),))} {counts[-2]}')
+                        lines.append(f'{name}_count{_labels(key)} {counts[-2]}')
+                        lines.append(f'{name}_sum{_labels(key)} {counts[-1]}')
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(key):
+    if not key:
+        return ''
+    return '{' + ','.join(f'{label}="{value}"' for label, value in key) + '}'
+
+
+class _NoPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Phase:
+    def __init__(self, phases, name):
+        self.phases = phases
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.phases[self.name] = self.phases.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+def phase(name):
+    """
+    Mide una fase de la solicitud actual (por ejemplo, 'auth'). Sin instrumentación activa no hace nada.
+    """
+    phases = g.get('phases') if has_request_context() else None
+    if phases is None:
+        return _NO_PHASE
+    return _Phase(phases, name)
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """
+    Proveedor JSON de Flask que registra el tiempo de serialización en la fase 'json'.
+    """
+
+    def dumps(self, obj, **kwargs):
+        with phase('json'):
+            return super().dumps(obj, **kwargs)
+
+
+def init_metrics(app, engines):
+    """
+    Activa la instrumentación: tiempos por fase de cada solicitud (auth, db, json y app), el encabezado
+    Server-Timing y los histogramas de latencia por ruta y código de estado.
+    """
+    registry = MetricsRegistry()
+    registry.histogram('posts_request_duration_seconds', 'Duración de las solicitudes por ruta y código de estado.')
+    registry.histogram('posts_request_phase_seconds', 'Duración de cada fase de las solicitudes.')
+    registry.counter('posts_users_service_requests_total', 'Llamadas al servicio de usuarios por resultado.')
+    app.extensions['metrics'] = registry
+    app.json = TimedJSONProvider(app)
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context() and g.get('phases') is not None:
+            conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get('query_start')
+        if starts and has_request_context() and g.get('phases') is not None:
+            phases = g.phases
+            phases['db'] = phases.get('db', 0.0) + time.perf_counter() - starts.pop()
+
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+
+    @app.before_request
+    def start_timing():
+        g.phases = {}
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def record_timing(response):
+        start = g.get('request_start')
+        if start is None:
+            return response
+
+        total = time.perf_counter() - start
+        phases = g.phases
+        phases['app'] = max(0.0, total - sum(phases.values()))
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+
+        registry.observe('posts_request_duration_seconds', total, route=route, method=request.method,
+                         status=response.status_code)
+        for name, seconds in phases.items():
+            registry.observe('posts_request_phase_seconds', seconds, phase=name)
+
+        timings = [f'{name};dur={seconds * 1000:.2f}' for name, seconds in phases.items()]
+        timings.append(f'total;dur={total * 1000:.2f}')
+        response.headers['Server-Timing'] = ', '.join(timings)
+        return response
+
+    return registry
+
+
+def register_state_metrics(registry, extensions):
+    """
+    Gauges del estado en memoria: aciertos, fallos y tamaño de las cachés y tamaño del índice de publicaciones.
+    """
+    caches = {name: extensions[key] for name, key in (('token', 'token_cache'), ('post', 'post_cache'))}
+
+    def cache_stat(stat):
+        return lambda: {(('cache', name),): cache.stats()[stat] for name, cache in caches.items()}
+
+    registry.gauge('posts_cache_hits', 'Aciertos de cada caché desde el inicio del proceso.', cache_stat('hits'))
+    registry.gauge('posts_cache_misses', 'Fallos de cada caché desde el inicio del proceso.', cache_stat('misses'))
+    registry.gauge('posts_cache_entries', 'Entradas de cada caché.', cache_stat('size'))
+
+    index = extensions.get('post_index')
+    if index is not None:
+        registry.gauge('posts_index_entries', 'Publicaciones en el índice en memoria.', lambda: {(): len(index)})
+        registry.gauge('posts_index_bytes', 'Tamaño aproximado del índice en memoria.',
+                       lambda: {(): index.stats()['approxBytes']})
+
+
+def register_pool_metrics(registry, engines):
+    """
+    Gauges de los pools de conexiones (TimedQueuePool) de cada engine: checkouts, espera acumulada y máxima,
+    timeouts y conexiones en uso.
+    """
+    def pool_stat(stat):
+        return lambda: {(('engine', name),): engine.pool.stats()[stat] for name, engine in engines.items()
+                        if isinstance(engine.pool, TimedQueuePool)}
+
+    registry.gauge('posts_db_pool_checkouts', 'Conexiones entregadas por el pool.', pool_stat('checkouts'))
+    registry.gauge('posts_db_pool_wait_seconds', 'Tiempo total esperando una conexión libre.', pool_stat('waitSeconds'))
+    registry.gauge('posts_db_pool_wait_max_seconds', 'Mayor espera por una conexión libre.', pool_stat('waitMaxSeconds'))
+    registry.gauge('posts_db_pool_timeouts', 'Checkouts que agotaron DB_POOL_TIMEOUT.', pool_stat('timeouts'))
+    registry.gauge('posts_db_pool_checked_out', 'Conexiones en uso.', pool_stat('checkedOut'))
+    registry.gauge('posts_db_pool_overflow', 'Conexiones abiertas por encima de DB_POOL_SIZE.', pool_stat('overflow'))
+
+
+def register_group_commit_metrics(registry, committer):
+    """
+    Histograma del número de publicaciones por transacción del group commit.
+    """
+    registry.histogram('posts_group_commit_batch_size', 'Publicaciones por transacción del group commit.',
+                       buckets=(1, 2, 5, 10, 25, 50, 100, 250))
+    committer.on_batch = lambda size: registry.observe('posts_group_commit_batch_size', size)
@@ -0,0 +1,65 @@
+import threading
+import time
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool que mide cuánto espera cada checkout por una conexión libre. Si la espera acumulada o
+    los timeouts crecen, el pool (DB_POOL_SIZE + DB_MAX_OVERFLOW) es pequeño para la carga.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds = 0.0
+        self._wait_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._stats_lock:
+                self._checkouts += 1
+                self._timeouts += timed_out
+                self._wait_seconds += elapsed
+                self._wait_max = max(self._wait_max, elapsed)
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "waitSeconds": self._wait_seconds,
+                "waitMaxSeconds": self._wait_max,
+                "checkedOut": self.checkedout(),
+                "overflow": max(self.overflow(), 0),
+                "size": self.size(),
+            }
+
+
+def pool_options(url, config):
+    """
+    Opciones del pool de conexiones para create_engine a partir de la configuración. SQLite usa los
+    pools por defecto de Flask-SQLAlchemy, por lo que no recibe opciones.
+    """
+    if make_url(url).get_backend_name() == 'sqlite':
+        return {}
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": config['DB_POOL_SIZE'],
+        "max_overflow": config['DB_MAX_OVERFLOW'],
+        "pool_timeout": config['DB_POOL_TIMEOUT'],
+        "pool_recycle": config['DB_POOL_RECYCLE'],
+        "pool_pre_ping": config['DB_POOL_PRE_PING'],
+    }
@@ -0,0 +1,215 @@
+import heapq
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from sqlalchemy import select
+from models import Post
+
+
+def _naive_utc(value):
+    # Las fechas se guardan como las devuelve la base de datos (UTC sin zona horaria)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class ActivePostIndex:
+    """
+    Índice en memoria de las publicaciones no expiradas, por routeId y por userId. Un heap de
+    mínimos sobre expireAt retira las publicaciones a medida que expiran, sin recorrer el índice.
+
+    Si se supera max_entries el índice queda incompleto y deja de responder consultas (las
+    vistas usan SQL) hasta la siguiente carga. Como cada worker tiene su propio índice, se
+    recarga cada refresh_interval segundos (PostIndexRefresher) para incorporar cambios hechos
+    por otros workers; si la recarga se atrasa más de dos intervalos tampoco responde consultas.
+    """
+
+    def __init__(self, max_entries=100000, refresh_interval=60, timer=time.monotonic):
+        self.max_entries = max_entries
+        self.refresh_interval = refresh_interval
+        self.complete = False
+        self.loaded_at = None
+        self._timer = timer
+        self._posts = {}
+        self._by_route = {}
+        self._by_user = {}
+        self._heap = []
+        self._journal = None
+        self._lock = threading.RLock()
+
+    @property
+    def stale(self):
+        return self.loaded_at is None or self._timer() - self.loaded_at >= 2 * self.refresh_interval
+
+    def load(self, session):
+        """
+        Carga el índice con las publicaciones no expiradas de la base de datos. Lee a lo sumo
+        max_entries + 1 filas: si hay más, el índice queda incompleto sin recorrer el resto de la tabla.
+        Las altas y bajas hechas mientras corre la consulta se registran y se aplican sobre el resultado.
+        """
+        now = datetime.now(timezone.utc)
+        stmt = select(Post.id, Post.routeId, Post.userId, Post.expireAt, Post.createdAt) \
+            .where(Post.expireAt >= now).limit(self.max_entries + 1)
+        with self._lock:
+            self._journal = []
+        try:
+            rows = session.execute(stmt).all()
+        finally:
+            with self._lock:
+                journal, self._journal = self._journal, None
+
+        with self._lock:
+            if len(rows) > self.max_entries:
+                self._reset(complete=False)
+            else:
+                self.clear()
+                for row in rows:
+                    self.add(row)
+                for added, value in journal:
+                    if added:
+                        self.add(value)
+                    else:
+                        self.remove(value)
+            self.loaded_at = self._timer()
+
+    def add(self, row):
+        """
+        Agrega una publicación, dada como tupla (id, routeId, userId, expireAt, createdAt).
+        """
+        id, route_id, user_id, expire_at, created_at = row
+        row = (id, route_id, user_id, _naive_utc(expire_at), _naive_utc(created_at))
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append((True, row))
+            if not self.complete:
+                return
+            if id not in self._posts and len(self._posts) >= self.max_entries:
+                # Se supera el presupuesto de memoria: el índice ya no puede responder consultas completas
+                self._reset(complete=False)
+                return
+
+            self._posts[id] = row
+            self._by_route.setdefault(route_id, {})[id] = row
+            self._by_user.setdefault(user_id, {})[id] = row
+            heapq.heappush(self._heap, (row[3], id))
+
+    def remove(self, id):
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append((False, id))
+            row = self._posts.pop(id, None)
+            if row is None:
+                return
+            self._discard(self._by_route, row[1], id)
+            self._discard(self._by_user, row[2], id)
+
+    def clear(self):
+        """
+        Vacía el índice. Sigue siendo completo (por ejemplo, después de un reset de la base de datos).
+        """
+        with self._lock:
+            self._reset(complete=True)
+
+    def query(self, route_id=None, user_id=None, now=None):
+        """
+        Retorna las publicaciones no expiradas que cumplen los filtros, o None si el índice no
+        puede responder la consulta.
+        """
+        with self._lock:
+            if not self.complete or self.stale:
+                return None
+
+            self.prune(now)
+            if route_id is not None and user_id is not None:
+                by_route = self._by_route.get(route_id, {})
+                by_user = self._by_user.get(user_id, {})
+                smaller, other = (by_route, by_user) if len(by_route) <= len(by_user) else (by_user, by_route)
+                return [row for id, row in smaller.items() if id in other]
+            if route_id is not None:
+                return list(self._by_route.get(route_id, {}).values())
+            if user_id is not None:
+                return list(self._by_user.get(user_id, {}).values())
+            return list(self._posts.values())
+
+    def prune(self, now=None):
+        """
+        Retira las publicaciones cuyo expireAt ya pasó.
+        """
+        now = _naive_utc(now or datetime.now(timezone.utc))
+        with self._lock:
+            while self._heap and self._heap[0][0] < now:
+                expire_at, id = heapq.heappop(self._heap)
+                row = self._posts.get(id)
+                # Las entradas del heap de publicaciones ya eliminadas se descartan aquí
+                if row is not None and row[3] == expire_at:
+                    self.remove(id)
+
+    def __len__(self):
+        return len(self._posts)
+
+    def stats(self):
+        with self._lock:
+            size = sys.getsizeof(self._posts) + sys.getsizeof(self._heap)
+            size += sum(sys.getsizeof(group) for group in self._by_route.values())
+            size += sum(sys.getsizeof(group) for group in self._by_user.values())
+            size += sum(sys.getsizeof(row) for row in self._posts.values())
+            return {
+                "entries": len(self._posts),
+                "routes": len(self._by_route),
+                "users": len(self._by_user),
+                "maxEntries": self.max_entries,
+                "complete": self.complete,
+                "approxBytes": size,
+            }
+
+    def _reset(self, complete):
+        self._posts = {}
+        self._by_route = {}
+        self._by_user = {}
+        self._heap = []
+        self.complete = complete
+
+    @staticmethod
+    def _discard(groups, key, id):
+        group = groups.get(key)
+        if group is not None:
+            group.pop(id, None)
+            if not group:
+                del groups[key]
+
+
+class PostIndexRefresher:
+    """
+    Recarga el índice cada refresh_interval segundos en un hilo en segundo plano, para que ninguna
+    solicitud haga la carga completa. Cada worker tiene su propio índice, por lo que el hilo se inicia
+    en el primer uso dentro de cada proceso (los hilos del master no sobreviven al fork de gunicorn).
+    """
+
+    def __init__(self, app, index, load):
+        self.app = app
+        self.index = index
+        self._load = load
+        self._pid = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def ensure_started(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                threading.Thread(target=self._loop, name='post-index-refresh', daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.wait(self.index.refresh_interval):
+            with self.app.app_context():
+                try:
+                    self._load()
+                except Exception:
+                    self.app.logger.exception('Índice de publicaciones: error recargando el índice')
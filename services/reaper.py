@@ -0,0 +1,71 @@
+import threading
+from datetime import datetime, timezone
+from sqlalchemy import DateTime, delete, insert, literal, select
+from models import Post, PostArchive
+
+ARCHIVED_COLUMNS = ('id', 'routeId', 'userId', 'expireAt', 'createdAt')
+
+
+def reap_expired_posts(session, retention, batch_size=500, max_batches=None, on_batch=None, now=None):
+    """
+    Mueve a post_archive las publicaciones cuyo expireAt es anterior a now - retention, en lotes
+    de batch_size filas con un commit por lote para no mantener bloqueos largos.
+    on_batch recibe los ids de cada lote después del commit. Retorna el número de filas movidas.
+    """
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - retention
+    moved = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        # skip_locked evita que dos reapers concurrentes (por ejemplo, varios workers) tomen las mismas filas
+        ids = session.execute(
+            select(Post.id)
+            .where(Post.expireAt < cutoff)
+            .order_by(Post.expireAt)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).scalars().all()
+        if not ids:
+            break
+
+        columns = [getattr(Post, name) for name in ARCHIVED_COLUMNS]
+        session.execute(insert(PostArchive).from_select(
+            [*ARCHIVED_COLUMNS, 'archivedAt'],
+            select(*columns, literal(now, DateTime)).where(Post.id.in_(ids))
+        ))
+        session.execute(delete(Post).where(Post.id.in_(ids)))
+        session.commit()
+
+        moved += len(ids)
+        batches += 1
+        if on_batch is not None:
+            on_batch(ids)
+
+    return moved
+
+
+class ReaperScheduler:
+    """
+    Ejecuta el reaper cada `interval` segundos en primer plano hasta que se llame a stop. Debe haber uno
+    solo por despliegue: `flask posts reap --interval` lo ejecuta en un proceso aparte.
+    """
+
+    def __init__(self, app, interval, run):
+        self.app = app
+        self.interval = interval
+        self.last_moved = None
+        self._run = run
+        self._stop = threading.Event()
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self):
+        while not self._stop.wait(self.interval):
+            with self.app.app_context():
+                try:
+                    self.last_moved = self._run()
+                    self.app.logger.info('Reaper: %s publicaciones archivadas', self.last_moved)
+                except Exception:
+                    self.app.logger.exception('Reaper: error archivando publicaciones')
@@ -0,0 +1,88 @@
+import time
+from contextlib import contextmanager
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+QUERY_BUCKETS = (1, 2, 3, 5, 10, 25, 50, 100)
+
+
+class SQLProfiler:
+    """
+    Perfilador de SQL sobre los eventos del engine: cuenta las sentencias de cada solicitud, mide
+    cada una y registra en el log las que superan slow_ms, sin sus parámetros. Con explain=True
+    también registra el plan de ejecución (EXPLAIN) de las consultas SELECT lentas.
+    """
+
+    def __init__(self, app, slow_ms=100, explain=False):
+        self.app = app
+        self.slow_ms = slow_ms
+        self.explain = explain
+
+    def attach(self, engine):
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    def init_app(self, app, engines):
+        for engine in engines:
+            self.attach(engine)
+
+        metrics = app.extensions.get('metrics')
+        if metrics is not None:
+            metrics.histogram('posts_sql_queries_per_request', 'Sentencias SQL por solicitud.', buckets=QUERY_BUCKETS)
+
+        @app.after_request
+        def report_queries(response):
+            count = g.get('sql_queries', 0)
+            app.logger.debug('%s %s: %s sentencias SQL', request.method, request.path, count)
+            if metrics is not None:
+                metrics.observe('posts_sql_queries_per_request', count,
+                                route=request.url_rule.rule if request.url_rule else 'unmatched')
+            return response
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if not conn.info.get('explaining'):
+            conn.info.setdefault('profiler_start', []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if conn.info.get('explaining') or not conn.info.get('profiler_start'):
+            return
+
+        elapsed_ms = (time.perf_counter() - conn.info['profiler_start'].pop()) * 1000
+        if has_request_context():
+            g.sql_queries = g.get('sql_queries', 0) + 1
+
+        if elapsed_ms >= self.slow_ms:
+            count = len(parameters) if parameters else 0
+            self.app.logger.warning('Consulta lenta (%.1f ms): %s [%s parámetros omitidos]',
+                                    elapsed_ms, ' '.join(statement.split()), count)
+            if self.explain and not executemany and statement.lstrip().upper().startswith('SELECT'):
+                self._log_plan(conn, statement, parameters)
+
+    def _log_plan(self, conn, statement, parameters):
+        prefix = 'EXPLAIN QUERY PLAN ' if conn.dialect.name == 'sqlite' else 'EXPLAIN '
+        conn.info['explaining'] = True
+        try:
+            plan = conn.exec_driver_sql(prefix + statement, parameters).fetchall()
+            self.app.logger.warning('Plan de ejecución:\n%s', '\n'.join(' '.join(map(str, row)) for row in plan))
+        except Exception:
+            self.app.logger.exception('No fue posible obtener el plan de ejecución')
+        finally:
+            conn.info['explaining'] = False
+
+
+@contextmanager
+def count_queries(engine):
+    """
+    Cuenta las sentencias SQL ejecutadas en el engine dentro del bloque. Retorna una lista con las sentencias.
+    """
+    statements = []
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not conn.info.get('explaining'):
+            statements.append(statement)
+
+    event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'after_cursor_execute', after_cursor_execute)
@@ -0,0 +1,132 @@
+import os
+import threading
+import time
+
+
+class UsersServiceUnavailable(Exception):
+    """
+    El servicio de usuarios no responde o el circuito está abierto.
+    """
+
+
+class CircuitBreaker:
+    """
+    Abre el circuito después de `threshold` fallos consecutivos. Mientras está abierto las llamadas
+    fallan de inmediato; pasado `reset_timeout` se permite una llamada de prueba (semiabierto).
+    """
+
+    def __init__(self, threshold=5, reset_timeout=30, timer=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._timer = timer
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if self._timer() - self.opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+    def allow(self):
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.opened_at is not None or self.failures >= self.threshold:
+                self.opened_at = self._timer()
+
+
+class UsersClient:
+    """
+    Cliente HTTP del servicio de usuarios con conexiones persistentes por proceso,
+    tiempos de espera acotados, reintentos limitados y circuit breaker.
+    """
+
+    def __init__(self, base_url, pool_size=10, connect_timeout=2, read_timeout=5, retries=2,
+                 breaker=None):
+        self.url_me = f'{base_url}/users/me'
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.breaker = breaker or CircuitBreaker()
+        self._session = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        breaker = CircuitBreaker(threshold=config['USERS_BREAKER_THRESHOLD'],
+                                 reset_timeout=config['USERS_BREAKER_RESET'])
+        return cls(config['USERS_PATH'],
+                   pool_size=config['USERS_POOL_SIZE'],
+                   connect_timeout=config['USERS_CONNECT_TIMEOUT'],
+                   read_timeout=config['USERS_READ_TIMEOUT'],
+                   retries=config['USERS_RETRIES'],
+                   breaker=breaker)
+
+    @property
+    def session(self):
+        # La sesión se crea por proceso para no compartir sockets entre workers después de un fork
+        if self._session is None or self._pid != os.getpid():
+            with self._lock:
+                if self._session is None or self._pid != os.getpid():
+                    self._session = self._create_session()
+                    self._pid = os.getpid()
+        return self._session
+
+    def _create_session(self):
+        # requests se importa al crear la primera sesión para no cargarlo en el arranque de cada worker
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(total=self.retries, connect=self.retries, read=0, status=self.retries,
+                      backoff_factor=0.1, status_forcelist=(502, 503, 504),
+                      allowed_methods=frozenset(['GET']), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def get_me(self, token):
+        """
+        Consulta el usuario dueño del token. Lanza UsersServiceUnavailable si el servicio
+        no responde, responde con error 5xx o el circuito está abierto.
+        """
+        if not self.breaker.allow():
+            raise UsersServiceUnavailable('Circuito abierto')
+
+        from requests import RequestException
+
+        try:
+            response = self.session.get(self.url_me, headers={'Authorization': token}, timeout=self.timeout)
+        except RequestException as e:
+            self.breaker.record_failure()
+            raise UsersServiceUnavailable(str(e)) from e
+
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return response
@@ -0,0 +1,122 @@
+import uuid
+from sqlalchemy import func, inspect, select, text
+from sqlalchemy.dialects import postgresql
+from models.types import UUID_PATTERN, is_valid_uuid
+
+UUID_COLUMNS = ('id', 'routeId', 'userId')
+SAMPLE_SIZE = 5
+
+
+class InvalidUUIDValues(ValueError):
+    """
+    La tabla tiene identificadores que no son UUID (versiones anteriores no validaban routeId ni userId).
+    Se detecta antes de modificar la base de datos, para que la migración no quede a medias.
+    """
+
+    def __init__(self, table, count, sample):
+        self.table = table
+        self.count = count
+        self.sample = sample
+        super().__init__(f'La tabla {table} tiene {count} identificadores que no son UUID (por ejemplo: '
+                         f'{", ".join(sample)}); se deben corregir o eliminar antes de migrar.')
+
+
+def migrate_uuid_columns(session, models, chunk_size=1000):
+    """
+    Convierte a UUID nativo las columnas id, routeId y userId que versiones anteriores guardaban como
+    texto. En Postgres cambia el tipo de las columnas (ALTER TABLE ... USING); en SQLite reescribe los
+    valores de texto como 16 bytes en bloques de chunk_size filas, con un commit por bloque.
+    Antes de convertir nada revisa todas las tablas y lanza InvalidUUIDValues si algún valor no es un UUID.
+    Retorna el número de filas convertidas.
+    """
+    postgres = session.get_bind().dialect.name == 'postgresql'
+    for model in models:
+        if postgres:
+            count, sample = _find_invalid_columns(session, model)
+        else:
+            count, sample = _find_invalid_values(session, model, chunk_size)
+        if count:
+            raise InvalidUUIDValues(model.__tablename__, count, sample)
+
+    if postgres:
+        return sum(_alter_columns(session, model) for model in models)
+    return sum(_rewrite_text_values(session, model, chunk_size) for model in models)
+
+
+def _text_columns(session, model):
+    columns = inspect(session.connection()).get_columns(model.__tablename__)
+    types = {column['name']: column['type'] for column in columns}
+    return [name for name in UUID_COLUMNS if not isinstance(types[name], postgresql.UUID)]
+
+
+def _find_invalid_columns(session, model):
+    table = model.__tablename__
+    count, sample = 0, []
+    for name in _text_columns(session, model):
+        invalid = f'FROM "{table}" WHERE "{name}" !~ :pattern'
+        params = {'pattern': f'^{UUID_PATTERN.pattern}$'}
+        count += session.execute(text(f'SELECT count(*) {invalid}'), params).scalar()
+        sample += session.execute(text(f'SELECT "{name}" {invalid} LIMIT {SAMPLE_SIZE}'), params).scalars().all()
+    return count, sample[:SAMPLE_SIZE]
+
+
+def _find_invalid_values(session, model, chunk_size):
+    table = model.__tablename__
+    columns = ', '.join(f'"{name}"' for name in UUID_COLUMNS)
+    pending = ' OR '.join(f'typeof("{name}") = \'text\'' for name in UUID_COLUMNS)
+
+    # Recorre las filas por rowid en bloques de chunk_size sin cargar la tabla completa
+    count, sample, last = 0, [], None
+    while True:
+        after = '' if last is None else 'rowid > :last AND'
+        rows = session.execute(text(f'SELECT rowid, {columns} FROM "{table}" WHERE {after} ({pending}) '
+                                    f'ORDER BY rowid LIMIT :limit'), {'last': last, 'limit': chunk_size}).all()
+        if not rows:
+            return count, sample
+
+        for _, *values in rows:
+            for value in values:
+                if isinstance(value, str) and not is_valid_uuid(value):
+                    count += 1
+                    if len(sample) < SAMPLE_SIZE:
+                        sample.append(value)
+        last = rows[-1][0]
+
+
+def _alter_columns(session, model):
+    table = model.__tablename__
+    pending = _text_columns(session, model)
+    if not pending:
+        return 0
+
+    rows = session.execute(select(func.count()).select_from(model)).scalar()
+    changes = ', '.join(f'ALTER COLUMN "{name}" TYPE uuid USING "{name}"::uuid' for name in pending)
+    session.execute(text(f'ALTER TABLE "{table}" {changes}'))
+    session.commit()
+    return rows
+
+
+def _rewrite_text_values(session, model, chunk_size):
+    table = model.__tablename__
+    columns = ', '.join(f'"{name}"' for name in UUID_COLUMNS)
+    pending = ' OR '.join(f'typeof("{name}") = \'text\'' for name in UUID_COLUMNS)
+    assignments = ', '.join(f'"{name}" = :{name}' for name in UUID_COLUMNS)
+
+    converted = 0
+    while True:
+        rows = session.execute(text(f'SELECT rowid, {columns} FROM "{table}" WHERE {pending} LIMIT :limit'),
+                               {'limit': chunk_size}).all()
+        if not rows:
+            return converted
+
+        params = [
+            dict(zip(UUID_COLUMNS, (_to_bytes(value) for value in values)), rowid=rowid)
+            for rowid, *values in rows
+        ]
+        session.execute(text(f'UPDATE "{table}" SET {assignments} WHERE rowid = :rowid'), params)
+        session.commit()
+        converted += len(rows)
+
+
+def _to_bytes(value):
+    return uuid.UUID(value).bytes if isinstance(value, str) else value
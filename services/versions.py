@@ -0,0 +1,50 @@
+import uuid
+
+EPOCH = 'epoch'
+ALL = 'all'
+
+
+class VersionMarkers:
+    """
+    Marcadores de versión de los listados de publicaciones, guardados en una caché (LRUCache o RedisCache).
+    'epoch' cambia con cambios masivos (reset, reaper); 'all', 'route:<id>' y 'user:<id>' con las
+    publicaciones creadas o eliminadas de cada filtro. Un marcador ausente o expirado se regenera, por lo
+    que con cachés por proceso la diferencia entre workers dura a lo sumo ttl segundos.
+    """
+
+    def __init__(self, cache, ttl):
+        self.cache = cache
+        self.ttl = ttl
+
+    def get(self, key):
+        version = self.cache.get(key)
+        if version is None:
+            version = uuid.uuid4().hex
+            self.cache.set(key, version, self.ttl)
+        return version
+
+    def bump(self, keys):
+        for key in keys:
+            self.cache.set(key, uuid.uuid4().hex, self.ttl)
+
+    def filter_keys(self, route_id=None, user_id=None):
+        """
+        Marcadores de los que depende un listado con los filtros dados.
+        """
+        keys = [EPOCH]
+        if route_id:
+            keys.append(f'route:{route_id}')
+        if user_id:
+            keys.append(f'user:{user_id}')
+        if not route_id and not user_id:
+            keys.append(ALL)
+        return keys
+
+    def posts_changed(self, route_ids=(), user_ids=()):
+        """
+        Invalida los listados afectados por publicaciones creadas o eliminadas en las rutas y usuarios dados.
+        """
+        self.bump([ALL, *(f'route:{id}' for id in set(route_ids)), *(f'user:{id}' for id in set(user_ids))])
+
+    def reset(self):
+        self.bump([EPOCH])
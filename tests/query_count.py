@@ -0,0 +1,19 @@
+from contextlib import contextmanager
+from db import db
+from services import count_queries
+
+
+class QueryCountMixin:
+    """
+    Mixin para TestCase que verifica el número máximo de sentencias SQL de un bloque. Requiere self.app.
+    """
+
+    @contextmanager
+    def assertMaxQueries(self, maximum):
+        with self.app.app_context():
+            engine = db.engine
+        with count_queries(engine) as statements:
+            yield statements
+        self.assertLessEqual(len(statements), maximum,
+                             f'Se ejecutaron {len(statements)} sentencias SQL (máximo {maximum}):\n'
+                             + '\n'.join(statements))
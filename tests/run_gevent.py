@@ -0,0 +1,15 @@
+"""
+Ejecuta la suite de pruebas en el modo asíncrono (gevent), como la corre gunicorn con ASYNC_MODE=gevent:
+    python -m tests.run_gevent
+"""
+from gevent import monkey
+
+monkey.patch_all()
+
+import sys  # noqa: E402
+import unittest  # noqa: E402
+
+if __name__ == '__main__':
+    argv = [sys.argv[0], 'discover', '-s', 'tests', '-t', '.'] + sys.argv[1:]
+    program = unittest.main(module=None, argv=argv, exit=False)
+    sys.exit(not program.result.wasSuccessful())
@@ -0,0 +1,43 @@
+import time
+import uuid
+from unittest import TestCase, skipUnless
+from app import create_app
+from tests.users_stub import UsersStub
+
+try:
+    from gevent import monkey
+    GEVENT_PATCHED = monkey.is_module_patched('socket')
+except ImportError:
+    GEVENT_PATCHED = False
+
+
+@skipUnless(GEVENT_PATCHED, 'Solo aplica en modo gevent (python -m tests.run_gevent)')
+class TestAsyncModeConcurrency(TestCase):
+
+    def test_requests_overlap_while_waiting_for_users_service(self):
+        import gevent
+        import requests
+        from gevent.pywsgi import WSGIServer
+
+        delay, concurrency = 0.2, 20
+        with UsersStub(delay=delay) as stub:
+            app = create_app(database='sqlite:///:memory:',
+                             config={'USERS_PATH': stub.url, 'USERS_POOL_SIZE': concurrency})
+            server = WSGIServer(('127.0.0.1', 0), app, log=None)
+            server.start()
+            try:
+                url = f'http://127.0.0.1:{server.server_port}/posts?route={uuid.uuid4()}'
+
+                def call(token):
+                    return requests.get(url, headers={'Authorization': f'Bearer {token}'}, timeout=10).status_code
+
+                start = time.monotonic()
+                jobs = [gevent.spawn(call, i) for i in range(concurrency)]
+                gevent.joinall(jobs)
+                elapsed = time.monotonic() - start
+            finally:
+                server.stop()
+
+        self.assertEqual([job.value for job in jobs], [200] * concurrency)
+        # En modo sync tomaría concurrency * delay; en modo gevent las esperas se solapan
+        self.assertLess(elapsed, concurrency * delay / 4)
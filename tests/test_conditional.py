@@ -0,0 +1,103 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+from app import create_app
+from tests.query_count import QueryCountMixin
+
+
+@patch('requests.Session.get')
+class TestConditionalRequests(QueryCountMixin, TestCase):
+
+    def setUp(self):
+        self.app = create_app(database='sqlite:///:memory:', config={'ETAG_VERSION_TTL': 300})
+        self.client = self.app.test_client()
+        self.headers = {'Authorization': 'Bearer token'}
+        self.route = str(uuid.uuid4())
+
+    def login(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+    def create(self, route, expire_at=None):
+        expire_at = expire_at or datetime.now(timezone.utc) + timedelta(days=1)
+        response = self.client.post('/posts', json={"routeId": route, "expireAt": expire_at.isoformat()},
+                                    headers=self.headers)
+        return response.get_json()['id']
+
+    def get(self, path, etag=None):
+        headers = dict(self.headers, **({'If-None-Match': etag} if etag else {}))
+        return self.client.get(path, headers=headers)
+
+    def test_list_etag(self, mock_get):
+        self.login(mock_get)
+        self.create(self.route)
+        path = f'/posts?route={self.route}'
+
+        response = self.get(path)
+        etag = response.headers['ETag']
+        with self.assertMaxQueries(0):
+            cached = self.get(path, etag)
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.data, b'')
+        self.assertEqual(cached.headers['ETag'], etag)
+
+        # Otra ruta no invalida el listado; una publicación nueva en la ruta sí
+        self.create(str(uuid.uuid4()))
+        self.assertEqual(self.get(path, etag).status_code, 304)
+        post_id = self.create(self.route)
+        response = self.get(path, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()), 2)
+
+        etag = response.headers['ETag']
+        self.client.delete(f'/posts/{post_id}', headers=self.headers)
+        self.assertEqual(self.get(path, etag).status_code, 200)
+
+        etag = self.get(path).headers['ETag']
+        self.client.post('/posts/reset')
+        self.assertEqual(self.get(path, etag).status_code, 200)
+
+    def test_etag_depends_on_parameters(self, mock_get):
+        self.login(mock_get)
+        self.create(self.route)
+        etag = self.get(f'/posts?route={self.route}').headers['ETag']
+        self.assertEqual(self.get(f'/posts?route={self.route}&limit=1', etag).status_code, 200)
+        self.assertEqual(self.get(f'/posts?route={self.route}&owner=me', etag).status_code, 200)
+
+    def test_expire_filter_boundary(self, mock_get):
+        self.login(mock_get)
+        expire_at = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(hours=1)
+        self.create(self.route, expire_at)
+
+        for expire in ('true', 'false'):
+            path = f'/posts?route={self.route}&expire={expire}'
+            etag = self.get(path).headers['ETag']
+            self.assertTrue(etag.endswith(f'.{int(expire_at.timestamp())}"'))
+            self.assertEqual(self.get(path, etag).status_code, 304)
+
+            # Después del vencimiento el listado cambia aunque no haya escrituras
+            with patch('views.conditional.datetime') as mock_datetime:
+                mock_datetime.now.return_value = expire_at + timedelta(seconds=1)
+                self.assertEqual(self.get(path, etag).status_code, 200)
+
+    def test_post_etag(self, mock_get):
+        self.login(mock_get)
+        post_id = self.create(self.route)
+
+        response = self.get(f'/posts/{post_id}')
+        self.assertEqual(response.headers['ETag'], f'"{post_id}"')
+        self.assertEqual(self.get(f'/posts/{post_id}', response.headers['ETag']).status_code, 304)
+
+        self.client.delete(f'/posts/{post_id}', headers=self.headers)
+        self.assertEqual(self.get(f'/posts/{post_id}', response.headers['ETag']).status_code, 404)
+
+    def test_list_etag_disabled_by_default(self, mock_get):
+        # Sin CACHE_URL los marcadores serían de cada proceso: los listados no llevan ETag
+        self.client = create_app(database='sqlite:///:memory:').test_client()
+        self.login(mock_get)
+        self.create(self.route)
+
+        response = self.get(f'/posts?route={self.route}')
+        self.assertNotIn('ETag', response.headers)
+        self.assertEqual(self.get(f'/posts?route={self.route}', '*').status_code, 200)
@@ -0,0 +1,96 @@
+import gzip
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+from app import create_app
+from views.encoders import msgpack_module
+
+
+class ContentNegotiationTestCase(TestCase):
+    config = {}
+
+    def setUp(self):
+        self.app = create_app(database='sqlite:///:memory:', config={'ETAG_VERSION_TTL': 300, **self.config})
+        self.client = self.app.test_client()
+        self.headers = {'Authorization': 'Bearer token'}
+        self.route = str(uuid.uuid4())
+
+    def create_posts(self, count):
+        expire_at = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+        body = [{"routeId": self.route, "expireAt": expire_at} for _ in range(count)]
+        return self.client.post('/posts/batch', json=body, headers=self.headers).get_json()
+
+    def get(self, path, **headers):
+        return self.client.get(path, headers=dict(self.headers, **headers))
+
+
+@patch('requests.Session.get')
+class TestGzip(ContentNegotiationTestCase):
+    config = {'GZIP_MIN_SIZE': 1024}
+
+    def test_large_responses_are_compressed(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+        self.create_posts(30)
+        path = f'/posts?route={self.route}'
+
+        plain = self.get(path)
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertIn('Accept-Encoding', plain.headers['Vary'])
+
+        compressed = self.get(path, **{'Accept-Encoding': 'gzip'})
+        self.assertEqual(compressed.headers['Content-Encoding'], 'gzip')
+        self.assertLess(len(compressed.data), len(plain.data))
+        self.assertEqual(json.loads(gzip.decompress(compressed.data)), plain.get_json())
+
+        # El ETag de la respuesta comprimida es débil y sigue sirviendo para If-None-Match
+        etag = compressed.headers['ETag']
+        self.assertTrue(etag.startswith('W/'))
+        self.assertEqual(self.get(path, **{'Accept-Encoding': 'gzip', 'If-None-Match': etag}).status_code, 304)
+
+    def test_small_responses_are_not_compressed(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+        post_id = self.create_posts(1)[0]['body']['id']
+        response = self.get(f'/posts/{post_id}', **{'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertIn('"id"', response.get_data(as_text=True))
+
+
+@skipUnless(msgpack_module(), 'Requiere el paquete msgpack')
+@patch('requests.Session.get')
+class TestMessagePack(ContentNegotiationTestCase):
+
+    def test_msgpack_responses(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+        post_id = self.create_posts(3)[0]['body']['id']
+        path = f'/posts?route={self.route}'
+
+        as_json = self.get(path)
+        as_msgpack = self.get(path, Accept='application/msgpack')
+        self.assertEqual(as_msgpack.mimetype, 'application/msgpack')
+        self.assertEqual(msgpack_module().unpackb(as_msgpack.data), as_json.get_json())
+        self.assertLess(len(as_msgpack.data), len(as_json.data))
+
+        # Cada formato tiene su propio ETag
+        self.assertNotEqual(as_msgpack.headers['ETag'], as_json.headers['ETag'])
+        self.assertEqual(self.get(path, Accept='application/msgpack',
+                                  **{'If-None-Match': as_json.headers['ETag']}).status_code, 200)
+
+        # Las respuestas por bloques siempre son JSON: su ETag no depende de Accept
+        streamed = self.get(f'{path}&stream=true', Accept='application/msgpack')
+        self.assertEqual(streamed.mimetype, 'application/json')
+        self.assertEqual(streamed.headers['ETag'], self.get(f'{path}&stream=true').headers['ETag'])
+
+        post = self.get(f'/posts/{post_id}', Accept='application/msgpack')
+        self.assertEqual(msgpack_module().unpackb(post.data)['id'], post_id)
+        self.assertEqual(post.headers['ETag'], f'"{post_id}.msgpack"')
+
+    def test_json_is_the_default(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+        self.assertEqual(self.get('/posts', Accept='*/*').mimetype, 'application/json')
+        self.assertEqual(self.get('/posts', Accept='text/html').mimetype, 'application/json')
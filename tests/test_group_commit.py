@@ -0,0 +1,96 @@
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+from app import create_app
+from services import GroupCommitter
+
+
+class TestGroupCommitter(TestCase):
+
+    def setUp(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def write(self, rows):
+        if any(row == 'bad' for row in rows):
+            raise ValueError('fila inválida')
+        with self.lock:
+            self.batches.append(list(rows))
+
+    def submit_all(self, committer, rows):
+        barrier = threading.Barrier(len(rows))
+
+        def submit(row):
+            barrier.wait()
+            try:
+                committer.submit(row)
+                return None
+            except ValueError as e:
+                return e
+
+        with ThreadPoolExecutor(len(rows)) as executor:
+            return list(executor.map(submit, rows))
+
+    def test_concurrent_rows_share_transactions(self):
+        committer = GroupCommitter(self.write, max_rows=8, max_wait=0.2)
+        results = self.submit_all(committer, list(range(20)))
+
+        self.assertEqual(results, [None] * 20)
+        self.assertEqual(sorted(row for batch in self.batches for row in batch), list(range(20)))
+        self.assertLess(len(self.batches), 20)
+        self.assertTrue(all(len(batch) <= 8 for batch in self.batches))
+        self.assertEqual(committer.stats(), {"batches": len(self.batches), "rows": 20})
+
+    def test_failure_only_affects_its_row(self):
+        committer = GroupCommitter(self.write, max_rows=10, max_wait=0.2)
+        rows = [1, 2, 'bad', 4]
+        results = self.submit_all(committer, rows)
+
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual([results[i] for i in (0, 1, 3)], [None, None, None])
+        self.assertEqual(sorted(row for batch in self.batches for row in batch), [1, 2, 4])
+
+    def test_single_request_waits_at_most_max_wait(self):
+        committer = GroupCommitter(self.write, max_rows=10, max_wait=0.01)
+        committer.submit(1)
+        self.assertEqual(self.batches, [[1]])
+
+    def test_callback_error_does_not_fail_rows(self):
+        def on_batch(size):
+            raise RuntimeError('métricas no disponibles')
+
+        committer = GroupCommitter(self.write, max_rows=10, max_wait=0.01, on_batch=on_batch)
+        with self.assertLogs('services.group_commit', level='ERROR'):
+            committer.submit(1)
+        self.assertEqual(self.batches, [[1]])
+
+
+class TestGroupCommitView(TestCase):
+
+    @patch('requests.Session.get')
+    def test_concurrent_creates(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+        app = create_app(database='sqlite:///:memory:', config={
+            'GROUP_COMMIT_ENABLED': True, 'GROUP_COMMIT_MAX_WAIT_MS': 100, 'METRICS_ENABLED': True})
+        client = app.test_client()
+        headers = {'Authorization': 'Bearer token'}
+        route = str(uuid.uuid4())
+        body = {"routeId": route, "expireAt": (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()}
+
+        with ThreadPoolExecutor(10) as executor:
+            responses = list(executor.map(lambda _: client.post('/posts', json=body, headers=headers), range(10)))
+
+        self.assertEqual({response.status_code for response in responses}, {201})
+        ids = {response.get_json()['id'] for response in responses}
+        listed = client.get(f'/posts?route={route}', headers=headers).get_json()
+        self.assertEqual({post['id'] for post in listed}, ids)
+
+        stats = app.extensions['group_commit'].stats()
+        self.assertEqual(stats['rows'], 10)
+        self.assertLess(stats['batches'], 10)
+        metrics = client.get('/posts/metrics').get_data(as_text=True)
+        self.assertIn(f'posts_group_commit_batch_size_count {stats["batches"]}', metrics)
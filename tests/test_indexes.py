@@ -0,0 +1,33 @@
+import os
+import tempfile
+from unittest import TestCase
+from sqlalchemy import create_engine, inspect, text
+from app import create_app
+from db import db
+
+
+class TestIndexes(TestCase):
+
+    def test_create_app_creates_indexes(self):
+        app = create_app(database='sqlite:///:memory:')
+        with app.app_context():
+            names = {index['name'] for index in inspect(db.engine).get_indexes('post')}
+        self.assertTrue({'ix_post_route_expire', 'ix_post_user_expire', 'ix_post_expire'} <= names)
+
+    def test_create_app_adds_indexes_to_existing_table(self):
+        fd, path = tempfile.mkstemp(suffix='.sqlite')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        # Tabla creada por una versión anterior, sin índices secundarios
+        engine = create_engine(f'sqlite:///{path}')
+        with engine.begin() as conn:
+            conn.execute(text('CREATE TABLE post (id VARCHAR PRIMARY KEY, "routeId" VARCHAR, '
+                              '"userId" VARCHAR, "expireAt" DATETIME, "createdAt" DATETIME)'))
+        engine.dispose()
+
+        app = create_app(database=f'sqlite:///{path}')
+        with app.app_context():
+            names = {index['name'] for index in inspect(db.engine).get_indexes('post')}
+            db.engine.dispose()
+        self.assertIn('ix_post_route_expire', names)
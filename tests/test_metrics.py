@@ -0,0 +1,54 @@
+import uuid
+from unittest import TestCase
+from unittest.mock import patch
+from app import create_app
+from services import MetricsRegistry
+
+
+class TestMetricsRegistry(TestCase):
+
+    def test_render_histogram_and_counter(self):
+        registry = MetricsRegistry()
+        registry.histogram('latency_seconds', 'Latencia.', buckets=(0.1, 1.0))
+        registry.counter('calls_total', 'Llamadas.')
+        registry.observe('latency_seconds', 0.5, route='/posts')
+        registry.inc('calls_total', outcome='200')
+
+        text = registry.render()
+        self.assertIn('latency_seconds_bucket{route="/posts",le="0.1"} 0', text)
+        self.assertIn('latency_seconds_bucket{route="/posts",le="1.0"} 1', text)
+        self.assertIn('latency_seconds_count{route="/posts"} 1', text)
+        self.assertIn('calls_total{outcome="200"} 1', text)
+
+
+class TestMetricsDisabled(TestCase):
+
+    def test_no_instrumentation(self):
+        client = create_app(database='sqlite:///:memory:').test_client()
+        self.assertEqual(client.get('/posts/metrics').status_code, 404)
+        self.assertNotIn('Server-Timing', client.get('/posts/ping').headers)
+
+
+class TestMetricsEnabled(TestCase):
+
+    def setUp(self):
+        app = create_app(database='sqlite:///:memory:', config={'METRICS_ENABLED': True})
+        self.client = app.test_client()
+
+    @patch('requests.Session.get')
+    def test_server_timing_and_metrics(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        response = self.client.get('/posts', headers={'Authorization': 'Bearer token'})
+        self.assertEqual(response.status_code, 200)
+        phases = [item.split(';')[0] for item in response.headers['Server-Timing'].split(', ')]
+        for name in ('auth', 'db', 'json', 'app', 'total'):
+            self.assertIn(name, phases)
+
+        metrics = self.client.get('/posts/metrics')
+        self.assertEqual(metrics.status_code, 200)
+        text = metrics.get_data(as_text=True)
+        self.assertIn('posts_request_duration_seconds_count{method="GET",route="/posts",status="200"} 1', text)
+        self.assertIn('posts_users_service_requests_total{outcome="200"} 1', text)
+        self.assertIn('posts_cache_misses{cache="token"} 1', text)
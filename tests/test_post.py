@@ -42,7 +42,7 @@ class TestGetPost(TestCase):
         self.app_ctx.pop()
         del self.app_ctx
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_post_success(self, mock_get):
         # Simulación de la respuesta del API de autenticación
         mock_get.return_value.status_code = 200
@@ -59,7 +59,7 @@ class TestGetPost(TestCase):
         response = self.client.get(f'/posts/{self.postId}')
         self.assertEqual(response.status_code, 403)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_post_invalid_token(self, mock_get):
         # Simulación de la respuesta del API de autenticación indicando token inválido
         mock_get.return_value.status_code = 401
@@ -68,7 +68,7 @@ class TestGetPost(TestCase):
                                    headers={'Authorization': 'Bearer invalid_token'})
         self.assertEqual(response.status_code, 401)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_post_invalid_id_format(self, mock_get):
         # Simulación de la respuesta del API de autenticación para un token válido
         mock_get.return_value.status_code = 200
@@ -79,7 +79,7 @@ class TestGetPost(TestCase):
                                    headers={'Authorization': 'Bearer valid_token'})
         self.assertEqual(response.status_code, 400)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_post_not_found(self, mock_get):
         # Simulación de la respuesta del API de autenticación para un token válido
         mock_get.return_value.status_code = 200
@@ -0,0 +1,70 @@
+import json
+import uuid
+from datetime import datetime, timezone, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+from app import create_app
+from db import db
+from models import Post
+
+
+class TestCreatePostsBatch(TestCase):
+
+    def setUp(self):
+        app = create_app(database='sqlite:///:memory:', config={'POSTS_BATCH_MAX': 5})
+        self.client = app.test_client()
+        self.app_ctx = app.app_context()
+        self.app_ctx.push()
+        self.user_id = str(uuid.uuid4())
+
+    def tearDown(self):
+        self.app_ctx.pop()
+        del self.app_ctx
+
+    def post_batch(self, data):
+        return self.client.post('/posts/batch', data=json.dumps(data),
+                                headers={'Authorization': 'Bearer token', 'Content-Type': 'application/json'})
+
+    def new_post(self, days=1):
+        return {'routeId': str(uuid.uuid4()), 'expireAt': (datetime.now(timezone.utc) + timedelta(days=days)).isoformat()}
+
+    @patch('requests.Session.get')
+    def test_create_batch_success(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": self.user_id}
+
+        response = self.post_batch([self.new_post() for _ in range(3)])
+        self.assertEqual(response.status_code, 201)
+
+        results = json.loads(response.data)
+        self.assertEqual([result['status'] for result in results], [201, 201, 201])
+        self.assertTrue(all(result['body']['userId'] == self.user_id for result in results))
+        self.assertEqual(db.session.query(Post).count(), 3)
+
+    @patch('requests.Session.get')
+    def test_create_batch_with_errors(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": self.user_id}
+
+        data = [self.new_post(), {'expireAt': self.new_post()['expireAt']}, self.new_post(days=-1)]
+        response = self.post_batch(data)
+        self.assertEqual(response.status_code, 207)
+
+        results = json.loads(response.data)
+        self.assertEqual([result['status'] for result in results], [201, 400, 412])
+        self.assertIn('routeId', results[1]['body']['errors:'])
+        self.assertEqual(db.session.query(Post).count(), 1)
+
+    @patch('requests.Session.get')
+    def test_create_batch_invalid_body(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": self.user_id}
+
+        self.assertEqual(self.post_batch(self.new_post()).status_code, 400)
+        self.assertEqual(self.post_batch([]).status_code, 400)
+        self.assertEqual(self.post_batch([self.new_post() for _ in range(6)]).status_code, 413)
+
+    def test_create_batch_missing_token(self):
+        response = self.client.post('/posts/batch', data=json.dumps([self.new_post()]),
+                                    headers={'Content-Type': 'application/json'})
+        self.assertEqual(response.status_code, 403)
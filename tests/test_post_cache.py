@@ -0,0 +1,93 @@
+import json
+import uuid
+from datetime import datetime, timezone, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+from app import create_app
+from db import db
+from models import Post
+
+
+class TestPostCache(TestCase):
+
+    def setUp(self):
+        app = create_app(database='sqlite:///:memory:', config={'POST_CACHE_SIZE': 4096})
+        self.client = app.test_client()
+        self.cache = app.extensions['post_cache']
+        self.app_ctx = app.app_context()
+        self.app_ctx.push()
+
+        self.postId = str(uuid.uuid4())
+        self.create_post(self.postId, timedelta(days=1))
+
+    def tearDown(self):
+        self.app_ctx.pop()
+        del self.app_ctx
+
+    def create_post(self, id, expire_in):
+        db.session.add(Post(id=id, routeId=str(uuid.uuid4()), userId=str(uuid.uuid4()),
+                            expireAt=datetime.now(timezone.utc) + expire_in, createdAt=datetime.now(timezone.utc)))
+        db.session.commit()
+
+    def remove_post_from_database(self, id):
+        # Elimina la fila sin pasar por la API, de modo que la caché no se entera
+        db.session.query(Post).filter_by(id=id).delete()
+        db.session.commit()
+
+    def get(self, id):
+        return self.client.get(f'/posts/{id}', headers={'Authorization': 'Bearer valid_token'})
+
+    @patch('requests.Session.get')
+    def test_read_through(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        first = self.get(self.postId)
+        self.remove_post_from_database(self.postId)
+        second = self.get(self.postId)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(json.loads(first.data), json.loads(second.data))
+
+    @patch('requests.Session.get')
+    def test_delete_invalidates(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        self.assertEqual(self.get(self.postId).status_code, 200)
+        response = self.client.delete(f'/posts/{self.postId}', headers={'Authorization': 'Bearer valid_token'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get(self.postId).status_code, 404)
+
+    @patch('requests.Session.get')
+    def test_reset_invalidates(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        self.assertEqual(self.get(self.postId).status_code, 200)
+        self.client.post('/posts/reset')
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.get(self.postId).status_code, 404)
+
+    @patch('requests.Session.get')
+    def test_not_found_is_cached(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        missing_id = str(uuid.uuid4())
+        self.assertEqual(self.get(missing_id).status_code, 404)
+        self.create_post(missing_id, timedelta(days=1))
+        self.assertEqual(self.get(missing_id).status_code, 404)
+
+        self.cache.clear()
+        self.assertEqual(self.get(missing_id).status_code, 200)
+
+    @patch('requests.Session.get')
+    def test_expired_post_is_not_cached(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        expired_id = str(uuid.uuid4())
+        self.create_post(expired_id, -timedelta(days=1))
+        self.assertEqual(self.get(expired_id).status_code, 200)
+        self.assertIsNone(self.cache.get(expired_id))
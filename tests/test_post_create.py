@@ -21,7 +21,7 @@ class TestCreatePost(TestCase):
         self.app_ctx.pop()
         del self.app_ctx
 
-    @patch('requests.get')  # Simula llamada al API de usuarios
+    @patch('requests.Session.get')  # Simula llamada al API de usuarios
     def test_create_post_success(self, mock_get):
         # Simulación de la respuesta del API de autenticación
         mock_get.return_value.status_code = 200
@@ -41,7 +41,7 @@ class TestCreatePost(TestCase):
         self.assertEqual(response.status_code, 201)
         self.assertIn('id', json.loads(response.data))
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_create_post_invalid_token(self, mock_get):
         mock_get.return_value.status_code = 401
 
@@ -65,7 +65,7 @@ class TestCreatePost(TestCase):
         response = self.client.post('/posts', data=json.dumps(data), headers={'Content-Type': 'application/json'})
         self.assertEqual(response.status_code, 403)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_create_post_bad_request(self, mock_get):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
@@ -44,14 +44,14 @@ class TestDeletePost(TestCase):
         response = self.client.delete(f'/posts/{self.postId}')
         self.assertEqual(response.status_code, 403)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_delete_post_invalid_token(self, mock_get):
         mock_get.return_value.status_code = 401
         response = self.client.delete(f'/posts/{self.postId}',
                                       headers={'Authorization': 'Bearer invalid_token'})
         self.assertEqual(response.status_code, 401)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_delete_post_success(self, mock_get):
         # Simulación de la respuesta del API de autenticación
         mock_get.return_value.status_code = 200
@@ -61,7 +61,7 @@ class TestDeletePost(TestCase):
                                       headers={'Authorization': 'Bearer valid_token'})
         self.assertEqual(response.status_code, 200)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_delete_post_not_found(self, mock_get):
         # Simulación de la respuesta del API de autenticación
         mock_get.return_value.status_code = 200
@@ -71,3 +71,70 @@ class TestDeletePost(TestCase):
                                       headers={'Authorization': 'Bearer valid_token'})
         self.assertEqual(response.status_code, 404)
 
+
+class TestDeletePostsBulk(TestCase):
+
+    def setUp(self):
+        app = create_app(database='sqlite:///:memory:', config={'POSTS_DELETE_BATCH': 2, 'ETAG_VERSION_TTL': 300})
+        self.client = app.test_client()
+        self.app_ctx = app.app_context()
+        self.app_ctx.push()
+
+        # 5 publicaciones expiradas y 1 activa del usuario, y 1 expirada de otro usuario
+        self.user_id = str(uuid.uuid4())
+        self.other_id = str(uuid.uuid4())
+        now = datetime.now(timezone.utc)
+        for user_id, expire_at in [(self.user_id, now - timedelta(hours=1))] * 5 + \
+                [(self.user_id, now + timedelta(days=1)), (self.other_id, now - timedelta(hours=1))]:
+            db.session.add(Post(id=str(uuid.uuid4()), routeId=str(uuid.uuid4()), userId=user_id,
+                                expireAt=expire_at, createdAt=now - timedelta(days=1)))
+        db.session.commit()
+        self.headers = {'Authorization': 'Bearer valid_token'}
+
+    def tearDown(self):
+        self.app_ctx.pop()
+        del self.app_ctx
+
+    @patch('requests.Session.get')
+    def test_delete_own_expired_posts(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": self.user_id}
+
+        before = self.client.get('/posts?owner=me', headers=self.headers)
+        response = self.client.delete('/posts?owner=me&expire=true', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data)['deleted'], 5)
+        self.assertEqual(Post.query.filter_by(userId=self.user_id).count(), 1)
+        self.assertEqual(Post.query.filter_by(userId=self.other_id).count(), 1)
+
+        # El listado en caché queda invalidado
+        after = self.client.get('/posts?owner=me', headers={**self.headers, 'If-None-Match': before.headers['ETag']})
+        self.assertEqual(after.status_code, 200)
+        self.assertEqual(len(json.loads(after.data)), 1)
+
+    @patch('requests.Session.get')
+    def test_delete_only_own_posts(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": self.user_id}
+        route = Post.query.filter_by(userId=self.other_id).first().routeId
+
+        # Un filtro por la ruta (o por el vencimiento) de otro usuario no elimina sus publicaciones
+        for query in [f'?route={route}', '?expire=true']:
+            response = self.client.delete(f'/posts{query}', headers=self.headers)
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(Post.query.filter_by(userId=self.other_id).count(), 1)
+        self.assertEqual(Post.query.filter_by(userId=self.user_id).count(), 1)
+
+        response = self.client.delete(f'/posts?owner={self.other_id}', headers=self.headers)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Post.query.filter_by(userId=self.other_id).count(), 1)
+
+    @patch('requests.Session.get')
+    def test_delete_requires_valid_filter(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": self.user_id}
+
+        for query in ['', '?expire=maybe', '?route=abc', '?limit=10']:
+            response = self.client.delete(f'/posts{query}', headers=self.headers)
+            self.assertEqual(response.status_code, 400, query)
+        self.assertEqual(Post.query.count(), 7)
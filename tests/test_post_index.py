@@ -0,0 +1,140 @@
+import json
+import time
+import uuid
+from datetime import datetime, timezone, timedelta
+from unittest import TestCase
+from unittest.mock import Mock, patch
+from app import create_app
+from db import db
+from models import Post
+from services import ActivePostIndex, PostIndexRefresher
+
+
+def new_row(route_id=None, user_id=None, expire_in=timedelta(days=1)):
+    now = datetime.now(timezone.utc)
+    return (str(uuid.uuid4()), route_id or str(uuid.uuid4()), user_id or str(uuid.uuid4()), now + expire_in, now)
+
+
+class TestActivePostIndex(TestCase):
+
+    def setUp(self):
+        self.index = ActivePostIndex(max_entries=3)
+        self.index.clear()
+        self.index.loaded_at = self.index._timer()
+
+    def test_query_by_route_and_owner(self):
+        route, user = str(uuid.uuid4()), str(uuid.uuid4())
+        both = new_row(route, user)
+        for row in (both, new_row(route), new_row(user_id=user)):
+            self.index.add(row)
+
+        self.assertEqual(len(self.index.query(route_id=route)), 2)
+        self.assertEqual(len(self.index.query(user_id=user)), 2)
+        self.assertEqual([row[0] for row in self.index.query(route_id=route, user_id=user)], [both[0]])
+
+    def test_prune_expired_posts(self):
+        short = new_row(expire_in=timedelta(minutes=1))
+        long = new_row(expire_in=timedelta(days=1))
+        self.index.add(short)
+        self.index.add(long)
+
+        later = datetime.now(timezone.utc) + timedelta(hours=1)
+        self.assertEqual([row[0] for row in self.index.query(now=later)], [long[0]])
+        self.assertEqual(len(self.index), 1)
+
+    def test_memory_budget(self):
+        for _ in range(4):
+            self.index.add(new_row())
+
+        self.assertFalse(self.index.complete)
+        self.assertIsNone(self.index.query())
+        self.assertEqual(self.index.stats()['entries'], 0)
+
+    def test_changes_during_load_are_kept(self):
+        kept, removed = new_row(), new_row()
+        added = new_row()
+
+        def execute(stmt):
+            # Una creación y una eliminación confirmadas mientras corre la consulta de carga
+            self.index.add(added)
+            self.index.remove(removed[0])
+            return Mock(all=Mock(return_value=[kept, removed]))
+
+        self.index.load(Mock(execute=execute))
+        self.assertEqual(sorted(row[0] for row in self.index.query()), sorted([kept[0], added[0]]))
+
+    def test_load_over_budget(self):
+        session = Mock()
+        session.execute.return_value.all.return_value = [new_row() for _ in range(4)]
+
+        self.index.load(session)
+        self.assertFalse(self.index.complete)
+        self.assertEqual(session.execute.call_args.args[0]._limit, 4)
+
+
+class TestPostIndexViews(TestCase):
+
+    def setUp(self):
+        app = create_app(database='sqlite:///:memory:', config={'POST_INDEX_ENABLED': True})
+        self.app = app
+        self.client = app.test_client()
+        self.index = app.extensions['post_index']
+        self.app_ctx = app.app_context()
+        self.app_ctx.push()
+        self.route = str(uuid.uuid4())
+
+    def tearDown(self):
+        self.app.extensions['post_index_refresher'].stop()
+        self.app_ctx.pop()
+        del self.app_ctx
+
+    def request(self, method, url, data=None):
+        return self.client.open(url, method=method, data=json.dumps(data) if data else None,
+                                headers={'Authorization': 'Bearer token', 'Content-Type': 'application/json'})
+
+    @patch('requests.Session.get')
+    def test_index_follows_create_and_delete(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        expire_at = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+        created = json.loads(self.request('POST', '/posts', {'routeId': self.route, 'expireAt': expire_at}).data)
+        self.request('POST', '/posts/batch', [{'routeId': self.route, 'expireAt': expire_at}])
+        self.assertEqual(len(self.index), 2)
+
+        response = self.request('GET', f'/posts?route={self.route}&expire=false')
+        from_index = json.loads(response.data)
+        self.assertEqual(len(from_index), 2)
+
+        # El índice devuelve exactamente lo mismo que la consulta SQL
+        from_sql = json.loads(self.request('GET', f'/posts?route={self.route}').data)
+        self.assertEqual(sorted(from_index, key=lambda post: post['id']), sorted(from_sql, key=lambda post: post['id']))
+
+        self.request('DELETE', f'/posts/{created["id"]}')
+        self.assertEqual(len(json.loads(self.request('GET', f'/posts?route={self.route}&expire=false').data)), 1)
+
+        self.request('POST', '/posts/reset')
+        self.assertEqual(len(self.index), 0)
+
+    @patch('requests.Session.get')
+    def test_refresh_picks_up_external_changes(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        row = new_row(self.route)
+        db.session.add(Post(id=row[0], routeId=row[1], userId=row[2], expireAt=row[3], createdAt=row[4]))
+        db.session.commit()
+        self.assertEqual(json.loads(self.request('GET', f'/posts?route={self.route}&expire=false').data), [])
+
+        # La recarga corre en segundo plano; las solicitudes nunca recargan el índice
+        self.app.extensions['post_index_refresher'].stop()
+        self.index.refresh_interval = 0.05
+        refresher = PostIndexRefresher(self.app, self.index, lambda: self.index.load(db.session))
+        loaded_at = self.index.loaded_at
+        refresher.ensure_started()
+        deadline = time.monotonic() + 5
+        while self.index.loaded_at == loaded_at and time.monotonic() < deadline:
+            time.sleep(0.05)
+        refresher.stop()
+        self.assertNotEqual(self.index.loaded_at, loaded_at)
+        self.assertEqual(len(json.loads(self.request('GET', f'/posts?route={self.route}&expire=false').data)), 1)
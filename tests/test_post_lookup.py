@@ -0,0 +1,63 @@
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+from app import create_app
+from tests.query_count import QueryCountMixin
+
+
+@patch('requests.Session.get')
+class TestPostsLookup(QueryCountMixin, TestCase):
+
+    def setUp(self):
+        self.app = create_app(database='sqlite:///:memory:', config={
+            'POSTS_LOOKUP_MAX': 10, 'POSTS_LOOKUP_CHUNK': 3, 'POST_CACHE_SIZE': 4096})
+        self.client = self.app.test_client()
+        self.headers = {'Authorization': 'Bearer token'}
+
+    def login(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+    def create_posts(self, count):
+        expire_at = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+        body = [{"routeId": str(uuid.uuid4()), "expireAt": expire_at} for _ in range(count)]
+        results = self.client.post('/posts/batch', json=body, headers=self.headers).get_json()
+        return [result['body']['id'] for result in results]
+
+    def lookup(self, body):
+        response = self.client.post('/posts/lookup', json=body, headers=self.headers)
+        return response.status_code, json.loads(response.data)
+
+    def test_lookup(self, mock_get):
+        self.login(mock_get)
+        ids = self.create_posts(5)
+        missing = [str(uuid.uuid4()), str(uuid.uuid4())]
+        requested = [missing[0], *reversed(ids), missing[1], ids[0].upper()]
+
+        # 7 ids distintos en bloques de 3: 3 consultas IN
+        with self.assertMaxQueries(3):
+            status, body = self.lookup({"ids": requested})
+        self.assertEqual(status, 200)
+        self.assertEqual([post['id'] for post in body['posts']], list(reversed(ids)))
+        self.assertEqual(body['missing'], missing)
+        self.assertEqual(body['posts'][-1], self.client.get(f'/posts/{ids[0]}', headers=self.headers).get_json())
+
+        # La segunda vez se responde desde la caché
+        with self.assertMaxQueries(0):
+            status, body = self.lookup({"ids": requested})
+        self.assertEqual(len(body['posts']), 5)
+
+    def test_invalid_requests(self, mock_get):
+        self.login(mock_get)
+        self.assertEqual(self.lookup({"ids": []})[0], 400)
+        self.assertEqual(self.lookup([str(uuid.uuid4())])[0], 400)
+        self.assertEqual(self.lookup({"ids": [str(uuid.uuid4()) for _ in range(11)]})[0], 413)
+
+        status, body = self.lookup({"ids": [str(uuid.uuid4()), 'abc', 7]})
+        self.assertEqual(status, 400)
+        self.assertIn('abc', body['msg'])
+
+        response = self.client.post('/posts/lookup', json={"ids": [str(uuid.uuid4())]})
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,87 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import patch
+from dateutil import parser
+from marshmallow import ValidationError
+from app import create_app
+from views.schemas.post_schemas import create_post_schema
+from views.util import parse_datetime
+
+
+class TestParseDatetime(TestCase):
+
+    def test_iso_format(self):
+        value = '2030-05-01T10:20:30+00:00'
+        self.assertEqual(parse_datetime(value), parser.parse(value))
+
+    def test_non_standard_format_falls_back_to_dateutil(self):
+        self.assertEqual(parse_datetime('May 1 2030 10:20'), datetime(2030, 5, 1, 10, 20))
+
+    def test_errors_are_the_same_as_dateutil(self):
+        for value in (None, 'not a date'):
+            with self.assertRaises(Exception) as expected:
+                parser.parse(value)
+            with self.assertRaises(Exception) as actual:
+                parse_datetime(value)
+            self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_schema_accepts_datetime_objects(self):
+        now = datetime.now(timezone.utc)
+        route_id, user_id = str(uuid.uuid4()), str(uuid.uuid4())
+        data = create_post_schema.load({'routeId': route_id, 'userId': user_id, 'expireAt': now, 'createdAt': now})
+        self.assertEqual(data['expireAt'], now)
+
+    def test_schema_validates_uuids(self):
+        now = datetime.now(timezone.utc)
+        route_id = str(uuid.uuid4()).upper()
+        data = create_post_schema.load({'routeId': route_id, 'userId': str(uuid.uuid4()), 'expireAt': now,
+                                        'createdAt': now})
+        self.assertEqual(data['routeId'], route_id.lower())
+        for value in ('r', route_id + 'x', f' {route_id}'):
+            with self.assertRaises(ValidationError):
+                create_post_schema.load({'routeId': value, 'userId': str(uuid.uuid4()), 'expireAt': now,
+                                         'createdAt': now})
+
+
+class TestCreatePostValidation(TestCase):
+
+    def setUp(self):
+        app = create_app(database='sqlite:///:memory:')
+        self.client = app.test_client()
+        self.app_ctx = app.app_context()
+        self.app_ctx.push()
+
+    def tearDown(self):
+        self.app_ctx.pop()
+        del self.app_ctx
+
+    def post(self, data):
+        return self.client.post('/posts', data=json.dumps(data),
+                                headers={'Authorization': 'Bearer token', 'Content-Type': 'application/json'})
+
+    @patch('requests.Session.get')
+    def test_non_standard_expire_at(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        response = self.post({'routeId': str(uuid.uuid4()), 'expireAt': 'Jan 1 2099 10:00'})
+        self.assertEqual(response.status_code, 201)
+
+    @patch('requests.Session.get')
+    def test_invalid_expire_at(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        response = self.post({'routeId': str(uuid.uuid4()), 'expireAt': 'mañana'})
+        self.assertEqual(response.status_code, 500)
+
+    @patch('requests.Session.get')
+    def test_missing_route_id(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        response = self.post({'expireAt': '2099-01-01T10:00:00'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('routeId', json.loads(response.data)['msg'])
@@ -49,7 +49,7 @@ class TestGetPosts(TestCase):
         self.app_ctx.pop()
         del self.app_ctx
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_post_no_filters(self, mock_get):
         # Simulación de la respuesta del API de autenticación
         mock_get.return_value.status_code = 200
@@ -61,7 +61,7 @@ class TestGetPosts(TestCase):
         data = json.loads(response.data)
         self.assertIsInstance(data, list)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_post_by_route(self, mock_get):
         test_route_id = self.route
 
@@ -74,7 +74,7 @@ class TestGetPosts(TestCase):
         data = json.loads(response.data)
         self.assertTrue(all(post['routeId'] == test_route_id for post in data))
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_post_by_owner(self, mock_get):
         test_owner_id = self.owner
 
@@ -87,7 +87,7 @@ class TestGetPosts(TestCase):
         data = json.loads(response.data)
         self.assertTrue(all(post['userId'] == test_owner_id for post in data))
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_post_by_expired(self, mock_get):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
@@ -0,0 +1,83 @@
+import json
+import uuid
+from datetime import datetime, timezone, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+from app import create_app
+from db import db
+from models import Post
+
+
+class TestPostsPagination(TestCase):
+
+    def setUp(self):
+        app = create_app(database='sqlite:///:memory:', config={'POSTS_PAGE_MAX': 10})
+        self.client = app.test_client()
+        self.app_ctx = app.app_context()
+        self.app_ctx.push()
+
+        # 25 publicaciones, varias con la misma fecha de creación para probar el desempate por id
+        self.route = str(uuid.uuid4())
+        now = datetime.now(timezone.utc)
+        for i in range(25):
+            db.session.add(Post(id=str(uuid.uuid4()), routeId=self.route, userId=str(uuid.uuid4()),
+                                expireAt=now + timedelta(days=1), createdAt=now - timedelta(minutes=i // 3)))
+        db.session.commit()
+
+    def tearDown(self):
+        self.app_ctx.pop()
+        del self.app_ctx
+
+    def get(self, query):
+        return self.client.get(f'/posts{query}', headers={'Authorization': 'Bearer valid_token'})
+
+    @patch('requests.Session.get')
+    def test_walk_all_pages(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        seen = []
+        response = self.get(f'?route={self.route}&limit=7')
+        while True:
+            self.assertEqual(response.status_code, 200)
+            page = json.loads(response.data)
+            self.assertLessEqual(len(page), 7)
+            seen.extend(page)
+            cursor = response.headers.get('X-Next-Cursor')
+            if not cursor:
+                break
+            response = self.get(f'?route={self.route}&limit=7&cursor={cursor}')
+
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(len({post['id'] for post in seen}), 25)
+        keys = [(post['createdAt'], post['id']) for post in seen]
+        self.assertEqual(keys, sorted(keys))
+
+    @patch('requests.Session.get')
+    def test_limit_is_capped(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        response = self.get('?limit=1000')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.data)), 10)
+        self.assertIn('X-Next-Cursor', response.headers)
+
+    @patch('requests.Session.get')
+    def test_invalid_parameters(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        self.assertEqual(self.get('?limit=0').status_code, 400)
+        self.assertEqual(self.get('?limit=abc').status_code, 400)
+        self.assertEqual(self.get('?cursor=not-a-cursor').status_code, 400)
+        self.assertEqual(self.get('?limit=5&page=2').status_code, 400)
+
+    @patch('requests.Session.get')
+    def test_without_pagination_returns_everything(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        response = self.get('')
+        self.assertEqual(len(json.loads(response.data)), 25)
+        self.assertNotIn('X-Next-Cursor', response.headers)
@@ -0,0 +1,90 @@
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+from app import create_app
+from db import db
+from models import Post
+from tests.query_count import QueryCountMixin
+
+
+class TestPostsStats(QueryCountMixin, TestCase):
+
+    def setUp(self):
+        self.app = create_app(database='sqlite:///:memory:')
+        self.client = self.app.test_client()
+        self.app_ctx = self.app.app_context()
+        self.app_ctx.push()
+
+        # Ruta A: 3 vigentes y 1 expirada del usuario 1; ruta B: 1 vigente del usuario 2
+        self.routes = [str(uuid.uuid4()), str(uuid.uuid4())]
+        self.users = [str(uuid.uuid4()), str(uuid.uuid4())]
+        now = datetime.now(timezone.utc).replace(minute=30, second=0, microsecond=0)
+        self.now = now
+        rows = [
+            (0, 0, now + timedelta(days=1), now),
+            (0, 0, now + timedelta(days=1), now),
+            (0, 0, now + timedelta(days=1), now - timedelta(hours=1)),
+            (0, 0, now - timedelta(days=1), now - timedelta(days=2)),
+            (1, 1, now + timedelta(days=1), now - timedelta(hours=1)),
+        ]
+        for route, user, expire_at, created_at in rows:
+            db.session.add(Post(id=str(uuid.uuid4()), routeId=self.routes[route], userId=self.users[user],
+                                expireAt=expire_at, createdAt=created_at))
+        db.session.commit()
+
+    def tearDown(self):
+        self.app_ctx.pop()
+        del self.app_ctx
+
+    def get(self, query):
+        response = self.client.get(f'/posts/stats{query}', headers={'Authorization': 'Bearer token'})
+        return response.status_code, json.loads(response.data)
+
+    @patch('requests.Session.get')
+    def test_totals_and_groups(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": self.users[1]}
+
+        with self.assertMaxQueries(2):
+            status, stats = self.get('?group=route')
+        self.assertEqual(status, 200)
+        self.assertEqual((stats['total'], stats['active'], stats['expired']), (5, 4, 1))
+        self.assertEqual(stats['groups'], [
+            {"routeId": self.routes[0], "total": 4, "active": 3, "expired": 1},
+            {"routeId": self.routes[1], "total": 1, "active": 1, "expired": 0},
+        ])
+
+        _, stats = self.get('?group=owner&limit=1')
+        self.assertEqual(stats['groups'], [{"userId": self.users[0], "total": 4, "active": 3, "expired": 1}])
+
+        # Los mismos filtros que GET /posts
+        _, stats = self.get(f'?route={self.routes[0]}&expire=true')
+        self.assertEqual((stats['total'], stats['active'], stats['expired']), (1, 0, 1))
+        _, stats = self.get('?owner=me&group=route')
+        self.assertEqual(stats['total'], 1)
+        self.assertEqual(stats['groups'][0]['routeId'], self.routes[1])
+
+    @patch('requests.Session.get')
+    def test_creation_buckets(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": self.users[0]}
+        hour = self.now.replace(minute=0, tzinfo=None)
+
+        _, stats = self.get('?bucket=hour&limit=2')
+        self.assertEqual(stats['buckets'], [
+            {"start": (hour - timedelta(hours=1)).isoformat(), "count": 2},
+            {"start": hour.isoformat(), "count": 2},
+        ])
+
+        _, stats = self.get('?bucket=day')
+        self.assertEqual(sum(bucket['count'] for bucket in stats['buckets']), 5)
+
+    @patch('requests.Session.get')
+    def test_invalid_parameters(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": self.users[0]}
+        for query in ('?group=expire', '?bucket=week', '?limit=0', '?route=abc', '?expire=maybe', '?cursor=x'):
+            status, _ = self.get(query)
+            self.assertEqual(status, 400, query)
@@ -0,0 +1,77 @@
+import json
+import uuid
+from datetime import datetime, timezone, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+from app import create_app
+from db import db
+from models import Post
+
+
+class TestPostsStream(TestCase):
+
+    def setUp(self):
+        app = create_app(database='sqlite:///:memory:', config={'STREAM_CHUNK_SIZE': 3})
+        self.client = app.test_client()
+        self.app_ctx = app.app_context()
+        self.app_ctx.push()
+
+        self.route = str(uuid.uuid4())
+        now = datetime.now(timezone.utc)
+        for _ in range(7):
+            db.session.add(Post(id=str(uuid.uuid4()), routeId=self.route, userId=str(uuid.uuid4()),
+                                expireAt=now + timedelta(days=1), createdAt=now))
+        db.session.add(Post(id=str(uuid.uuid4()), routeId=str(uuid.uuid4()), userId=str(uuid.uuid4()),
+                            expireAt=now + timedelta(days=1), createdAt=now))
+        db.session.commit()
+
+    def tearDown(self):
+        self.app_ctx.pop()
+        del self.app_ctx
+
+    def get(self, query, accept='application/json'):
+        return self.client.get(f'/posts{query}', headers={'Authorization': 'Bearer valid_token', 'Accept': accept})
+
+    @patch('requests.Session.get')
+    def test_stream_json_array(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        response = self.get(f'?route={self.route}&stream=true')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        streamed = json.loads(response.data)
+
+        expected = json.loads(self.get(f'?route={self.route}').data)
+        self.assertEqual(sorted(streamed, key=lambda post: post['id']), sorted(expected, key=lambda post: post['id']))
+
+    @patch('requests.Session.get')
+    def test_stream_ndjson(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        response = self.get(f'?route={self.route}', accept='application/x-ndjson')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual(len(lines), 7)
+        self.assertTrue(all(json.loads(line)['routeId'] == self.route for line in lines))
+
+    @patch('requests.Session.get')
+    def test_stream_empty_result(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        response = self.get(f'?route={uuid.uuid4()}&stream=true')
+        self.assertEqual(json.loads(response.data), [])
+
+        response = self.get(f'?route={uuid.uuid4()}', accept='application/x-ndjson')
+        self.assertEqual(response.data, b'')
+
+    @patch('requests.Session.get')
+    def test_stream_invalid_value(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        response = self.get('?stream=yes')
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,72 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+from app import create_app
+from tests.query_count import QueryCountMixin
+
+
+class TestQueryCounts(QueryCountMixin, TestCase):
+
+    def setUp(self):
+        self.app = create_app(database='sqlite:///:memory:', config={'POST_CACHE_SIZE': 4096})
+        self.client = self.app.test_client()
+        self.headers = {'Authorization': 'Bearer token'}
+        self.user_id = str(uuid.uuid4())
+        self.expire_at = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+
+    def create_posts(self, count):
+        body = [{"routeId": str(uuid.uuid4()), "expireAt": self.expire_at} for _ in range(count)]
+        return self.client.post('/posts/batch', json=body, headers=self.headers).get_json()
+
+    @patch('requests.Session.get')
+    def test_endpoint_query_budgets(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": self.user_id}
+
+        with self.assertMaxQueries(1):
+            self.create_posts(20)
+
+        with self.assertMaxQueries(2):
+            response = self.client.post('/posts', json={"routeId": str(uuid.uuid4()), "expireAt": self.expire_at},
+                                        headers=self.headers)
+        post_id = response.get_json()['id']
+
+        with self.assertMaxQueries(1):
+            self.assertEqual(len(self.client.get('/posts', headers=self.headers).get_json()), 21)
+
+        with self.assertMaxQueries(1):
+            self.client.get('/posts?owner=me&expire=false&limit=5', headers=self.headers)
+
+        with self.assertMaxQueries(1):
+            self.client.get(f'/posts/{post_id}', headers=self.headers)
+        with self.assertMaxQueries(0):
+            self.client.get(f'/posts/{post_id}', headers=self.headers)
+
+        with self.assertMaxQueries(1):
+            self.client.delete(f'/posts/{post_id}', headers=self.headers)
+
+        with self.assertMaxQueries(4):
+            self.client.post('/posts/reset')
+
+
+class TestSQLProfiler(TestCase):
+
+    @patch('requests.Session.get')
+    def test_slow_query_log_without_parameters(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+        app = create_app(database='sqlite:///:memory:',
+                         config={'SQL_PROFILER_ENABLED': True, 'SQL_SLOW_MS': 0, 'SQL_EXPLAIN': True})
+        client = app.test_client()
+        route_id = str(uuid.uuid4())
+
+        with self.assertLogs(app.logger, level='WARNING') as logs:
+            response = client.get(f'/posts?route={route_id}', headers={'Authorization': 'Bearer token'})
+
+        self.assertEqual(response.status_code, 200)
+        output = '\n'.join(logs.output)
+        self.assertIn('Consulta lenta', output)
+        self.assertIn('parámetros omitidos', output)
+        self.assertIn('Plan de ejecución', output)
+        self.assertNotIn(route_id, output)
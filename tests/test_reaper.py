@@ -0,0 +1,95 @@
+import json
+import threading
+import time
+import uuid
+from datetime import datetime, timezone, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+from app import create_app
+from db import db
+from models import Post, PostArchive
+from services import ReaperScheduler, reap_expired_posts
+from commands import run_reaper
+
+
+class TestReaper(TestCase):
+
+    def setUp(self):
+        app = create_app(database='sqlite:///:memory:')
+        self.app = app
+        self.client = app.test_client()
+        self.app_ctx = app.app_context()
+        self.app_ctx.push()
+
+        # 5 publicaciones expiradas hace 2 días, 1 expirada hace 1 hora y 1 activa
+        self.route = str(uuid.uuid4())
+        now = datetime.now(timezone.utc)
+        for expire_at in [now - timedelta(days=2)] * 5 + [now - timedelta(hours=1), now + timedelta(days=1)]:
+            db.session.add(Post(id=str(uuid.uuid4()), routeId=self.route, userId=str(uuid.uuid4()),
+                                expireAt=expire_at, createdAt=expire_at - timedelta(days=1)))
+        db.session.commit()
+
+    def tearDown(self):
+        self.app_ctx.pop()
+        del self.app_ctx
+
+    def test_reap_in_batches(self):
+        batches = []
+        moved = reap_expired_posts(db.session, timedelta(days=1), batch_size=2, on_batch=batches.append)
+
+        self.assertEqual(moved, 5)
+        self.assertEqual([len(ids) for ids in batches], [2, 2, 1])
+        self.assertEqual(db.session.query(Post).count(), 2)
+        self.assertEqual(db.session.query(PostArchive).count(), 5)
+
+    def test_reap_max_batches(self):
+        moved = reap_expired_posts(db.session, timedelta(days=1), batch_size=2, max_batches=1)
+        self.assertEqual(moved, 2)
+
+    def test_reap_command(self):
+        result = self.app.test_cli_runner().invoke(args=['posts', 'reap', '--retention-hours', '24'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('5 publicaciones archivadas', result.output)
+
+    @patch('requests.Session.get')
+    def test_archived_posts_are_reachable(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+        run_reaper(retention_hours=24)
+
+        headers = {'Authorization': 'Bearer token'}
+        expired = json.loads(self.client.get(f'/posts?route={self.route}&expire=true', headers=headers).data)
+        self.assertEqual(len(expired), 1)
+
+        with_archive = json.loads(self.client.get(f'/posts?route={self.route}&expire=true&archived=true',
+                                                  headers=headers).data)
+        self.assertEqual(len(with_archive), 6)
+
+        # La paginación recorre también las publicaciones archivadas
+        response = self.client.get(f'/posts?route={self.route}&archived=true&limit=4', headers=headers)
+        self.assertEqual(len(json.loads(response.data)), 4)
+        cursor = response.headers['X-Next-Cursor']
+        response = self.client.get(f'/posts?route={self.route}&archived=true&limit=4&cursor={cursor}',
+                                   headers=headers)
+        self.assertEqual(len(json.loads(response.data)), 3)
+
+        self.assertEqual(self.client.get('/posts?archived=yes', headers=headers).status_code, 400)
+
+    def test_scheduler(self):
+        scheduler = ReaperScheduler(self.app, 0.05, run_reaper)
+        thread = threading.Thread(target=scheduler.run, daemon=True)
+        thread.start()
+        try:
+            deadline = time.monotonic() + 5
+            while scheduler.last_moved is None and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            scheduler.stop()
+            thread.join()
+        self.assertEqual(scheduler.last_moved, 5)
+
+    def test_app_does_not_start_reaper(self):
+        # El reaper se ejecuta con `flask posts reap --interval`, nunca dentro de cada worker
+        threads = set(threading.enumerate())
+        create_app(database='sqlite:///:memory:', config={'REAPER_INTERVAL': 0.05})
+        self.assertEqual(set(threading.enumerate()), threads)
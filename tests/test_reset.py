@@ -1,11 +1,11 @@
 import json
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from unittest import TestCase
 from faker import Faker
 from app import create_app
 from db import db
-from models import Post
+from models import Post, PostArchive
 
 
 class TestReset(TestCase):
@@ -46,3 +46,41 @@ class TestReset(TestCase):
 
         # Verify response
         self.assertIn("msg", resp)
+
+
+class TestResetInChunks(TestCase):
+    def setUp(self):
+        app = create_app(database='sqlite:///:memory:',
+                         config={'RESET_CHUNK_SIZE': 2, 'POST_INDEX_ENABLED': True, 'POST_CACHE_SIZE': 4096})
+        self.app = app
+        self.client = app.test_client()
+        self.app_ctx = app.app_context()
+        self.app_ctx.push()
+
+        now = datetime.now(timezone.utc)
+        for _ in range(5):
+            db.session.add(Post(id=str(uuid.uuid4()), routeId=str(uuid.uuid4()), userId=str(uuid.uuid4()),
+                                expireAt=now + timedelta(days=1), createdAt=now))
+        for _ in range(3):
+            db.session.add(PostArchive(id=str(uuid.uuid4()), routeId=str(uuid.uuid4()), userId=str(uuid.uuid4()),
+                                       expireAt=now, createdAt=now, archivedAt=now))
+        db.session.commit()
+
+    def tearDown(self):
+        self.app_ctx.pop()
+        del self.app_ctx
+
+    def test_reset_deletes_in_chunks_and_clears_state(self):
+        self.app.extensions['post_cache'].set('id', {"id": "id"}, 60)
+        self.app.extensions['post_index'].load(db.session)
+
+        with self.assertLogs(self.app.logger, level='INFO') as logs:
+            result = self.client.post("/posts/reset", data='')
+
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(db.session.query(Post).count(), 0)
+        self.assertEqual(db.session.query(PostArchive).count(), 0)
+        self.assertIn('INFO:app:Reset: 5 filas eliminadas de post', logs.output)
+        self.assertIn('INFO:app:Reset: 3 filas eliminadas de post_archive', logs.output)
+        self.assertEqual(len(self.app.extensions['post_cache']), 0)
+        self.assertEqual(len(self.app.extensions['post_index']), 0)
@@ -0,0 +1,35 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+from sqlalchemy import inspect
+from app import create_app
+from db import db
+
+
+class TestSchemaCreation(TestCase):
+
+    def test_init_db_command(self):
+        app = create_app(database='sqlite:///:memory:', config={'DB_CREATE_ALL': False})
+        with app.app_context():
+            self.assertFalse(inspect(db.engine).has_table('post'))
+
+        result = app.test_cli_runner().invoke(args=['posts', 'init-db'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('Esquema de la base de datos creado', result.output)
+
+        with app.app_context():
+            inspector = inspect(db.engine)
+            self.assertTrue(inspector.has_table('post'))
+            self.assertTrue(inspector.has_table('post_archive'))
+            self.assertIn('ix_post_route_expire', {index['name'] for index in inspector.get_indexes('post')})
+
+
+class TestLazyImports(TestCase):
+
+    def test_create_app_does_not_import_requests(self):
+        code = ("import sys; from app import create_app; create_app(database='sqlite:///:memory:'); "
+                "print(','.join(m for m in ('requests', 'dateutil.parser') if m in sys.modules))")
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(result.stdout.strip(), '')
@@ -0,0 +1,155 @@
+import fnmatch
+import uuid
+from unittest import TestCase
+from unittest.mock import patch
+from app import create_app
+from services import LRUCache, RedisCache, build_cache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache(TestCase):
+
+    def test_expire_entries(self):
+        timer = FakeTimer()
+        cache = LRUCache(maxsize=10, timer=timer)
+        cache.set('a', 1, ttl=5)
+        self.assertEqual(cache.get('a'), 1)
+
+        timer.now = 6
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_evict_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1, ttl=60)
+        cache.set('b', 2, ttl=60)
+        cache.get('a')
+        cache.set('c', 3, ttl=60)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(len(cache), 2)
+
+
+class FakeRedis:
+    """
+    Cliente de Redis en memoria con los comandos que usa RedisCache (get, set con px, delete, scan_iter).
+    """
+
+    def __init__(self, timer):
+        self.timer = timer
+        self.data = {}
+
+    def get(self, key):
+        value, expires_at = self.data.get(key, (None, None))
+        if value is not None and expires_at <= self.timer():
+            del self.data[key]
+            return None
+        return value
+
+    def set(self, key, value, px):
+        self.data[key] = (value, self.timer() + px / 1000)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match) and self.get(key) is not None]
+
+
+class TestRedisCache(TestCase):
+
+    def setUp(self):
+        self.timer = FakeTimer()
+        self.client = FakeRedis(self.timer)
+        self.cache = RedisCache('redis://localhost', prefix='post:', client=self.client)
+
+    def test_get_set_and_expire(self):
+        self.cache.set('a', {"id": "a"}, ttl=5)
+        self.cache.set('b', False, ttl=0)
+        self.assertEqual(self.cache.get('a'), {"id": "a"})
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(list(self.client.data), ['post:a'])
+
+        self.timer.now = 6
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(self.cache.stats()['misses'], 2)
+
+    def test_delete_and_clear_by_prefix(self):
+        other = RedisCache('redis://localhost', prefix='token:', client=self.client)
+        for key in ('a', 'b', 'c'):
+            self.cache.set(key, key, ttl=60)
+        other.set('a', 'token', ttl=60)
+
+        self.cache.delete('a')
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(len(self.cache), 2)
+
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(other.get('a'), 'token')
+
+    def test_zero_size_disables_any_backend(self):
+        cache = build_cache('redis://localhost', maxsize=0, prefix='post:')
+        cache.set('a', 1, ttl=60)
+        self.assertIsNone(cache.get('a'))
+
+
+class TestTokenCache(TestCase):
+
+    def setUp(self):
+        app = create_app(database='sqlite:///:memory:')
+        self.client = app.test_client()
+        self.cache = app.extensions['token_cache']
+        self.app_ctx = app.app_context()
+        self.app_ctx.push()
+
+    def tearDown(self):
+        self.app_ctx.pop()
+        del self.app_ctx
+
+    @patch('requests.Session.get')
+    def test_valid_token_is_cached(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+
+        for _ in range(3):
+            response = self.client.get('/posts', headers={'Authorization': 'Bearer valid_token'})
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(self.cache.stats()['hits'], 2)
+        # El token no se guarda en claro
+        self.assertNotIn('Bearer valid_token', self.cache._data)
+
+    @patch('requests.Session.get')
+    def test_invalid_token_is_cached(self, mock_get):
+        mock_get.return_value.status_code = 401
+
+        for _ in range(2):
+            response = self.client.get('/posts', headers={'Authorization': 'Bearer invalid_token'})
+            self.assertEqual(response.status_code, 401)
+
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('requests.Session.get')
+    def test_service_errors_are_not_cached(self, mock_get):
+        mock_get.return_value.status_code = 500
+        mock_get.return_value.text = 'error'
+
+        for _ in range(2):
+            response = self.client.get('/posts', headers={'Authorization': 'Bearer token'})
+            self.assertEqual(response.status_code, 500)
+
+        self.assertEqual(mock_get.call_count, 2)
@@ -0,0 +1,79 @@
+import json
+from unittest import TestCase
+from app import create_app
+from services import CircuitBreaker, UsersClient, UsersServiceUnavailable
+from tests.users_stub import UsersStub
+
+
+class TestUsersClient(TestCase):
+
+    def create_client(self, stub, **options):
+        config = {'USERS_PATH': stub.url, 'TOKEN_CACHE_SIZE': 0}
+        config.update(options)
+        app = create_app(database='sqlite:///:memory:', config=config)
+        return app.test_client()
+
+    def test_verify_token_against_stub(self):
+        with UsersStub() as stub:
+            client = self.create_client(stub)
+            response = client.get('/posts', headers={'Authorization': 'Bearer valid_token'})
+            self.assertEqual(response.status_code, 200)
+
+            response = client.get('/posts', headers={'Authorization': 'Bearer invalid_token'})
+            self.assertEqual(response.status_code, 401)
+
+    def test_reuses_connections(self):
+        with UsersStub() as stub:
+            users = UsersClient(stub.url)
+            for _ in range(3):
+                self.assertEqual(users.get_me('Bearer token').status_code, 200)
+
+            pool = users.session.get_adapter(stub.url).poolmanager.connection_from_url(stub.url)
+            self.assertEqual(pool.num_connections, 1)
+
+    def test_read_timeout_returns_503(self):
+        with UsersStub(delay=0.5) as stub:
+            client = self.create_client(stub, USERS_READ_TIMEOUT=0.1)
+            response = client.get('/posts', headers={'Authorization': 'Bearer valid_token'})
+            self.assertEqual(response.status_code, 503)
+            self.assertIn('msg', json.loads(response.data))
+
+    def test_retries_are_bounded(self):
+        with UsersStub(status=503) as stub:
+            users = UsersClient(stub.url, retries=2)
+            response = users.get_me('Bearer token')
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(stub.requests, 3)
+
+    def test_circuit_opens_and_fails_fast(self):
+        with UsersStub(status=500) as stub:
+            client = self.create_client(stub, USERS_BREAKER_THRESHOLD=2, USERS_RETRIES=0)
+            for _ in range(2):
+                response = client.get('/posts', headers={'Authorization': 'Bearer valid_token'})
+                self.assertEqual(response.status_code, 500)
+
+            response = client.get('/posts', headers={'Authorization': 'Bearer valid_token'})
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(stub.requests, 2)
+
+
+class TestCircuitBreaker(TestCase):
+
+    def test_half_open_after_reset_timeout(self):
+        now = [0.0]
+        breaker = CircuitBreaker(threshold=1, reset_timeout=10, timer=lambda: now[0])
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+
+        now[0] = 11
+        self.assertTrue(breaker.allow())
+        # Solo se permite una llamada de prueba a la vez
+        self.assertFalse(breaker.allow())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, 'closed')
+
+    def test_unavailable_when_service_is_down(self):
+        users = UsersClient('http://127.0.0.1:9', retries=0, connect_timeout=0.2)
+        with self.assertRaises(UsersServiceUnavailable):
+            users.get_me('Bearer token')
@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+from sqlalchemy import create_engine, text
+from app import create_app
+from db import db
+from models import is_valid_uuid
+
+
+class TestUUIDValidation(TestCase):
+
+    def test_is_valid_uuid(self):
+        value = str(uuid.uuid4())
+        self.assertTrue(is_valid_uuid(value))
+        self.assertTrue(is_valid_uuid(value.upper()))
+        for invalid in (value + 'extra', value[:-1], value.replace('-', ''), '', None, 'me'):
+            self.assertFalse(is_valid_uuid(invalid))
+
+
+class TestUUIDStorage(TestCase):
+
+    def setUp(self):
+        self.app = create_app(database='sqlite:///:memory:')
+        self.client = self.app.test_client()
+        self.headers = {'Authorization': 'Bearer token'}
+        self.user_id = str(uuid.uuid4())
+        self.expire_at = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+
+    @patch('requests.Session.get')
+    def test_ids_are_stored_as_16_bytes(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": self.user_id}
+        route_id = str(uuid.uuid4())
+
+        created = self.client.post('/posts', json={"routeId": route_id.upper(), "expireAt": self.expire_at},
+                                   headers=self.headers).get_json()
+        with self.app.app_context():
+            stored = db.session.execute(text('SELECT id, "routeId", "userId" FROM post')).one()
+        self.assertEqual([len(value) for value in stored], [16, 16, 16])
+
+        post = self.client.get(f'/posts/{created["id"].upper()}', headers=self.headers).get_json()
+        self.assertEqual(post['id'], created['id'])
+        self.assertEqual(post['routeId'], route_id)
+        self.assertEqual(post['userId'], self.user_id)
+
+        self.assertEqual(len(self.client.get(f'/posts?route={route_id.upper()}', headers=self.headers).get_json()), 1)
+        self.assertEqual(self.client.get('/posts?owner=not-a-uuid', headers=self.headers).get_json(), [])
+
+        response = self.client.post('/posts', json={"routeId": "not-a-uuid", "expireAt": self.expire_at},
+                                    headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('routeId', json.loads(response.data)['msg'])
+
+
+class TestUUIDMigration(TestCase):
+
+    def legacy_database(self, rows):
+        """
+        Base de datos creada por una versión anterior, con los identificadores como texto.
+        """
+        fd, path = tempfile.mkstemp(suffix='.sqlite')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        engine = create_engine(f'sqlite:///{path}')
+        with engine.begin() as conn:
+            conn.execute(text('CREATE TABLE post (id VARCHAR PRIMARY KEY, "routeId" VARCHAR, '
+                              '"userId" VARCHAR, "expireAt" DATETIME, "createdAt" DATETIME)'))
+            conn.execute(text('INSERT INTO post VALUES (:id, :route, :user, :expire, :created)'), [
+                {'id': id, 'route': route, 'user': user, 'expire': '2999-01-01 00:00:00',
+                 'created': '2024-01-01 00:00:00'} for id, route, user in rows])
+        engine.dispose()
+        return path
+
+    @patch('requests.Session.get')
+    def test_migrate_text_ids(self, mock_get):
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"id": str(uuid.uuid4())}
+        rows = [(str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())) for _ in range(5)]
+        path = self.legacy_database(rows)
+
+        app = create_app(database=f'sqlite:///{path}')
+        result = app.test_cli_runner().invoke(args=['posts', 'migrate-uuid', '--chunk-size', '2'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('5 filas convertidas', result.output)
+        self.assertIn('0 filas convertidas', app.test_cli_runner().invoke(args=['posts', 'migrate-uuid']).output)
+
+        client = app.test_client()
+        id, route_id, user_id = rows[0]
+        post = json.loads(client.get(f'/posts/{id}', headers={'Authorization': 'Bearer token'}).data)
+        self.assertEqual((post['id'], post['routeId'], post['userId']), rows[0])
+        self.assertEqual(post['expireAt'], '2999-01-01T00:00:00')
+        with app.app_context():
+            db.engine.dispose()
+
+    def test_migrate_rejects_invalid_ids(self):
+        # Versiones anteriores aceptaban cualquier texto en routeId
+        rows = [(str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())),
+                (str(uuid.uuid4()), 'ruta-1', str(uuid.uuid4())),
+                (str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4()))]
+        path = self.legacy_database(rows)
+
+        app = create_app(database=f'sqlite:///{path}')
+        result = app.test_cli_runner().invoke(args=['posts', 'migrate-uuid', '--chunk-size', '1'])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('1 identificadores que no son UUID', result.output)
+        self.assertIn('ruta-1', result.output)
+
+        # No se convirtió ninguna fila
+        with app.app_context():
+            types = db.session.execute(text('SELECT DISTINCT typeof(id) FROM post')).scalars().all()
+            db.engine.dispose()
+        self.assertEqual(types, ['text'])
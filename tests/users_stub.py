@@ -0,0 +1,75 @@
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address):
+        # Los clientes que abandonan la conexión por timeout no son un error del stub
+        pass
+
+
+class UsersStub:
+    """
+    Servidor HTTP local que simula el servicio de usuarios (GET /users/me).
+    Los tokens 'Bearer invalid...' reciben 401; el resto recibe el id de un usuario fijo por token.
+    """
+
+    def __init__(self, delay=0.0, status=200):
+        self.delay = delay
+        self.status = status
+        self.requests = 0
+        self.users = {}
+        self._server = _Server(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                stub.requests += 1
+                if stub.delay:
+                    time.sleep(stub.delay)
+
+                token = self.headers.get('Authorization', '')
+                if stub.status != 200:
+                    self._reply(stub.status, {"msg": "error"})
+                elif token.startswith('Bearer invalid'):
+                    self._reply(401, {"msg": "Unauthorized"})
+                else:
+                    user_id = stub.users.setdefault(token, str(uuid.uuid4()))
+                    self._reply(200, {"id": user_id})
+
+            def _reply(self, status, body):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,54 @@
+import hashlib
+from datetime import datetime, timezone
+from flask import current_app, request
+from db import reading_replica
+
+
+def list_digest(route_id, owner, mimetype):
+    """
+    Huella de un listado de GET /posts: los marcadores de versión de sus filtros, los parámetros de la
+    consulta y el formato de la respuesta. Se calcula sin leer filas y antes de consultarlas, por lo que una
+    escritura concurrente puede a lo sumo provocar una descarga adicional. Retorna None si los ETag de los
+    listados están desactivados o si el listado se lee de la réplica: los marcadores son del primario y la
+    réplica puede no reflejarlos aún.
+    """
+    markers = current_app.extensions['version_markers']
+    if markers.ttl <= 0 or reading_replica():
+        return None
+    versions = [markers.get(key) for key in markers.filter_keys(route_id, owner)]
+    params = sorted((key, value) for key, value in request.args.items(multi=True) if key != 'owner')
+    raw = repr((versions, params, owner, mimetype)).encode()
+    return hashlib.sha256(raw).hexdigest()[:32]
+
+
+def post_etag(id, mimetype):
+    """
+    ETag de GET /posts/<id>: las publicaciones no cambian después de creadas, por lo que basta con el id
+    y el formato de la respuesta.
+    """
+    return id if mimetype == 'application/json' else f'{id}.{mimetype.rsplit("/", 1)[-1]}'
+
+
+def list_etag(digest, boundary=None):
+    """
+    ETag de un listado: la huella y, en los listados filtrados por expire, el instante (en segundos UTC)
+    hasta el cual el resultado no cambia por el paso del tiempo.
+    """
+    if boundary is None:
+        return f'{digest}.0'
+    return f'{digest}.{int(boundary.replace(tzinfo=timezone.utc).timestamp())}'
+
+
+def list_not_modified(digest):
+    """
+    Indica si algún ETag de If-None-Match corresponde a la huella actual y su límite de vencimiento no ha pasado.
+    """
+    if request.if_none_match.star_tag:
+        return True
+
+    now = datetime.now(timezone.utc).timestamp()
+    for etag in request.if_none_match.as_set(include_weak=True):
+        etag_digest, _, boundary = etag.partition('.')
+        if etag_digest == digest and boundary.isdigit() and (boundary == '0' or now < int(boundary)):
+            return True
+    return False
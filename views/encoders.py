@@ -0,0 +1,46 @@
+import functools
+from flask import Response, jsonify, request
+from services import phase
+
+JSON = 'application/json'
+NDJSON = 'application/x-ndjson'
+MSGPACK = 'application/msgpack'
+MSGPACK_MIMETYPES = (MSGPACK, 'application/x-msgpack')
+
+
+@functools.cache
+def msgpack_module():
+    """
+    El paquete msgpack es opcional: si no está instalado solo se ofrece JSON.
+    """
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+
+def response_mimetype():
+    """
+    Formato de la respuesta según el encabezado Accept: MessagePack si el cliente lo prefiere
+    (y msgpack está instalado) o JSON en cualquier otro caso.
+    """
+    offered = [JSON, *MSGPACK_MIMETYPES] if msgpack_module() else [JSON]
+    best = request.accept_mimetypes.best_match(offered, default=JSON)
+    return MSGPACK if best in MSGPACK_MIMETYPES else JSON
+
+
+def respond(data, status=200, mimetype=None):
+    """
+    Respuesta con los datos codificados en el formato dado o, si no se indica, en el negociado con response_mimetype.
+    """
+    mimetype = mimetype or response_mimetype()
+    if mimetype == JSON:
+        response = jsonify(data)
+    else:
+        with phase('msgpack'):
+            body = msgpack_module().packb(data)
+        response = Response(body, mimetype=mimetype)
+    response.status_code = status
+    response.vary.add('Accept')
+    return response
@@ -1,4 +1,4 @@
-from flask import Blueprint, Response
+from flask import Blueprint, Response, abort, current_app
 from flask.views import MethodView
 from .util import class_route
 
@@ -11,3 +11,15 @@ class HealthCheck(MethodView):
 
     def get(self):
         return Response("pong", status=200, mimetype='text/plain')
+
+
+@class_route(blp, "/metrics")
+class Metrics(MethodView):
+    init_every_request = False
+
+    def get(self):
+        # Métricas en formato de texto de Prometheus (solo con METRICS_ENABLED)
+        registry = current_app.extensions.get('metrics')
+        if registry is None:
+            abort(404)
+        return Response(registry.render(), status=200, content_type='text/plain; version=0.0.4; charset=utf-8')
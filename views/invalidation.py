@@ -0,0 +1,44 @@
+from flask import current_app
+
+
+def posts_created(rows):
+    """
+    Actualiza el estado en memoria con publicaciones nuevas, dadas como tuplas
+    (id, routeId, userId, expireAt, createdAt). Se llama después del commit.
+    """
+    index = current_app.extensions.get('post_index')
+    if index is not None:
+        for row in rows:
+            index.add(row)
+    current_app.extensions['version_markers'].posts_changed(
+        route_ids=[row[1] for row in rows], user_ids=[row[2] for row in rows])
+
+
+def posts_deleted(ids, route_ids=None, user_ids=None):
+    """
+    Invalida el estado en memoria asociado a publicaciones eliminadas. Se llama después del commit.
+    Si no se conocen sus rutas y usuarios (por ejemplo, en el reaper) se invalidan todos los listados.
+    """
+    cache = current_app.extensions['post_cache']
+    index = current_app.extensions.get('post_index')
+    for id in ids:
+        cache.delete(id)
+        if index is not None:
+            index.remove(id)
+
+    markers = current_app.extensions['version_markers']
+    if route_ids is None or user_ids is None:
+        markers.reset()
+    else:
+        markers.posts_changed(route_ids=route_ids, user_ids=user_ids)
+
+
+def posts_cleared():
+    """
+    Invalida todo el estado en memoria asociado a publicaciones (por ejemplo, después de un reset).
+    """
+    current_app.extensions['post_cache'].clear()
+    index = current_app.extensions.get('post_index')
+    if index is not None:
+        index.clear()
+    current_app.extensions['version_markers'].reset()
@@ -1,33 +1,212 @@
-import os
-import requests
+import hashlib
+import json
 import uuid
 from datetime import datetime, timezone
-from dateutil import parser
 from marshmallow import ValidationError
-from db import db
-from flask import Blueprint, request, Response, jsonify, g, abort
+from db import db, reading_replica
+from sqlalchemy import case, delete, false, func, insert, literal_column, select, tuple_, union_all
+from flask import Blueprint, request, Response, jsonify, g, abort, current_app, stream_with_context
 from flask.views import MethodView
-from .util import class_route, create_error_response
-from .schemas.post_schemas import CreatePostSchema, ErrorResponseSchema, ResetPostsResponseSchema
-from models import Post
-import re
+from .conditional import list_digest, list_etag, list_not_modified, post_etag
+from .encoders import JSON, NDJSON, respond, response_mimetype
+from .invalidation import posts_created, posts_deleted
+from .serializers import POST_COLUMNS, serialize_post
+from .util import class_route, create_error_response, encode_cursor, decode_cursor, parse_datetime, read_replica, \
+    wants_primary
+from .schemas.post_schemas import create_post_schema, create_posts_schema, error_response_schema
+from models import Post, PostArchive, is_valid_uuid
+from services import UsersServiceUnavailable, phase
 
 blp = Blueprint("Post", __name__)
 
-USERS_PATH = os.getenv('USERS_PATH')
-url_users = f'{USERS_PATH}/users/me'
+
+def stream_posts(stmt, mimetype):
+    """
+    Envía los resultados de la consulta a medida que se leen de la base de datos, en bloques
+    de STREAM_CHUNK_SIZE filas, como NDJSON (una publicación por línea) o como un arreglo JSON.
+    """
+    chunk_size = current_app.config['STREAM_CHUNK_SIZE']
+    ndjson = mimetype == NDJSON
+
+    def encode(items, continued):
+        if ndjson:
+            return ''.join(item + '\n' for item in items)
+        return (',' if continued else '') + ','.join(items)
+
+    def generate():
+        if not ndjson:
+            yield '['
+        buffer = []
+        continued = False
+        for row in db.session.execute(stmt.execution_options(yield_per=chunk_size)):
+            buffer.append(json.dumps(serialize_post(row), separators=(',', ':')))
+            if len(buffer) >= chunk_size:
+                yield encode(buffer, continued)
+                buffer.clear()
+                continued = True
+        if buffer:
+            yield encode(buffer, continued)
+        if not ndjson:
+            yield ']'
+
+    return Response(stream_with_context(generate()), status=200, mimetype=mimetype)
+
+
+def prepare_post(payload, user_id, created_at):
+    """
+    Extrae los datos de una publicación nueva y los organiza para validarlos con CreatePostSchema.
+    """
+    route_id = payload.get('routeId')
+    expire_at = payload.get('expireAt')
+
+    # Organizar expireAt (se entrega como datetime al esquema, sin convertirlo de nuevo a cadena)
+    expire_at = parse_datetime(expire_at)
+    expire_at = expire_at.replace(tzinfo=timezone.utc, microsecond=0)
+
+    return {
+        'routeId': route_id,
+        'userId': user_id,
+        'expireAt': expire_at,
+        'createdAt': created_at
+    }
+
+
+def post_cache_ttl(expire_at):
+    """
+    Tiempo en caché de una publicación: como máximo POST_CACHE_TTL y nunca más allá de su expireAt.
+    """
+    if expire_at.tzinfo is None:
+        expire_at = expire_at.replace(tzinfo=timezone.utc)
+    remaining = (expire_at - datetime.now(timezone.utc)).total_seconds()
+    return min(current_app.config['POST_CACHE_TTL'], remaining)
+
+
+def insert_posts(rows):
+    """
+    Inserta las publicaciones (diccionarios con las columnas de Post) con un único INSERT de varias filas
+    en una transacción y actualiza el estado en memoria.
+    """
+    try:
+        db.session.execute(insert(Post).values(rows))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    posts_created([tuple(row[column.key] for column in POST_COLUMNS) for row in rows])
+
+
+def delete_posts(condition):
+    """
+    Elimina con un único DELETE las publicaciones que cumplen la condición, hace commit y actualiza el estado
+    en memoria. Retorna el número de publicaciones eliminadas.
+    """
+    columns = (Post.id, Post.routeId, Post.userId)
+    stmt = delete(Post).execution_options(synchronize_session=False)
+    if db.session.get_bind().dialect.delete_returning:
+        rows = db.session.execute(stmt.where(condition).returning(*columns)).all()
+    else:
+        rows = db.session.execute(select(*columns).where(condition)).all()
+        db.session.execute(stmt.where(Post.id.in_([row.id for row in rows])))
+    db.session.commit()
+
+    if rows:
+        posts_deleted([row.id for row in rows], route_ids=[row.routeId for row in rows],
+                      user_ids=[row.userId for row in rows])
+    return len(rows)
+
+
+def post_filters(model, route_id, owner, expire_filter):
+    """
+    Condiciones de los filtros de GET /posts sobre el modelo dado (Post o PostArchive).
+    """
+    conditions = []
+
+    # Filtrar por routeId si se proporciona
+    if route_id:
+        conditions.append(model.routeId == route_id)
+
+    # Filtrar por userId si se proporciona
+    if owner:
+        # Un dueño que no es un UUID no puede tener publicaciones
+        conditions.append(model.userId == owner if is_valid_uuid(owner) else false())
+
+    # Filtrar por estado de expiración si se proporciona
+    if expire_filter is not None:
+        if expire_filter.lower() == 'true':
+            conditions.append(model.expireAt < datetime.now(timezone.utc))
+        elif expire_filter.lower() == 'false':
+            conditions.append(model.expireAt >= datetime.now(timezone.utc))
+
+    return conditions
+
+
+def filter_params():
+    """
+    Lee y valida los filtros route, owner y expire de GET /posts, que comparten GET /posts/stats y
+    DELETE /posts. El dueño 'me' se resuelve con el usuario del token. Retorna (route_id, owner,
+    expire_filter) o lanza ValueError con el nombre del parámetro inválido.
+    """
+    expire_filter = request.args.get('expire', type=str)
+    route_id = request.args.get('route', type=str)
+    owner = request.args.get('owner', type=str)
+
+    # Validar que el routeId sea un UUID válido
+    if route_id and not is_valid_uuid(route_id):
+        raise ValueError('route')
+
+    # Validar que el expire sea 'true' o 'false'
+    if expire_filter and expire_filter.lower() not in ['true', 'false']:
+        raise ValueError('expire')
+
+    # Resolver el dueño 'me' con el usuario del token
+    if owner == 'me':
+        owner = g.user_id
+    return route_id and route_id.lower(), owner and owner.lower(), expire_filter
+
+
+def next_expiration(route_id, owner, expire_filter, posts):
+    """
+    Instante en que el listado filtrado por expire cambia por el paso del tiempo: el menor expireAt de las
+    publicaciones vigentes, que son las que salen de expire=false o entran a expire=true al vencer.
+    """
+    if not expire_filter:
+        return None
+    if expire_filter.lower() == 'false':
+        return min((post[3] for post in posts), default=None)
+    return db.session.execute(
+        select(func.min(Post.expireAt)).where(*post_filters(Post, route_id, owner, 'false'))).scalar()
 
 
-# url_users = 'http://localhost:8010/users/me'
+STATS_GROUPS = {'route': 'routeId', 'owner': 'userId'}
+STATS_BUCKETS = {'hour': '%Y-%m-%dT%H:00:00', 'day': '%Y-%m-%dT00:00:00'}
 
 
-def is_valid_uuid(uuid_to_test):
+def created_bucket(bucket):
     """
-    Comprueba si uuid_to_test es un UUID válido en formato de cadena.
+    Inicio del intervalo ('hour' o 'day') de la fecha de creación, como expresión SQL del dialecto actual.
     """
-    regex = r'[0-9a-fA-F]{8}\b-[0-9a-fA-F]{4}\b-[0-9a-fA-F]{4}\b-[0-9a-fA-F]{4}\b-[0-9a-fA-F]{12}'
-    match = re.match(regex, uuid_to_test)
-    return bool(match)
+    if db.session.get_bind().dialect.name == 'postgresql':
+        # Literal y no parámetro: Postgres debe ver la misma expresión en el SELECT y en el GROUP BY
+        return func.date_trunc(literal_column(f"'{bucket}'"), Post.createdAt)
+    return func.strftime(STATS_BUCKETS[bucket], Post.createdAt)
+
+
+def not_modified(etag):
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def active_posts(route_id, owner):
+    """
+    Publicaciones no expiradas de la ruta y/o el dueño según el índice en memoria, o None si el
+    índice está desactivado o no puede responder la consulta.
+    """
+    index = current_app.extensions.get('post_index')
+    if index is None:
+        return None
+    current_app.extensions['post_index_refresher'].ensure_started()
+    return index.query(route_id=route_id or None, user_id=owner or None)
 
 
 @blp.before_request
@@ -36,53 +215,84 @@ def verify_token():
 
     if not token:
         error = {"msg": "Token is required"}
-        return Response(ErrorResponseSchema().dumps(error), status=403)
+        return Response(error_response_schema.dumps(error), status=403)
+
+    # Consultar primero la caché de tokens (la llave es el hash del token, nunca el token)
+    cache = current_app.extensions['token_cache']
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    user_id = cache.get(cache_key)
+    if user_id is None:
+        user_id = _resolve_token(token, cache, cache_key)
+        if isinstance(user_id, Response):
+            return user_id
+
+    if user_id is False:
+        # Token inválido o expirado (resultado en caché)
+        error = {"msg": "Invalid or expired token"}
+        return Response(error_response_schema.dumps(error), status=401)
 
-    headers = {'Authorization': token}
-    response = requests.get(url_users, headers=headers)
+    # Token is valid, save user id
+    g.user_id = user_id
+
+
+def _resolve_token(token, cache, cache_key):
+    """
+    Verifica el token contra el servicio de usuarios y guarda el resultado en caché.
+    Retorna el id del usuario, False si el token es inválido o una respuesta de error.
+    """
+    metrics = current_app.extensions.get('metrics')
+    try:
+        with phase('auth'):
+            response = current_app.extensions['users_client'].get_me(token)
+    except UsersServiceUnavailable:
+        if metrics is not None:
+            metrics.inc('posts_users_service_requests_total', outcome='unavailable')
+        error = {"msg": "Servicio de usuarios no disponible"}
+        return Response(error_response_schema.dumps(error), status=503)
+
+    if metrics is not None:
+        metrics.inc('posts_users_service_requests_total', outcome=str(response.status_code))
 
     if response.status_code == 401:
         # Token is invalid or expired
-        error = {"msg": "Invalid or expired token"}
-        return Response(ErrorResponseSchema().dumps(error), status=401)
+        cache.set(cache_key, False, current_app.config['TOKEN_CACHE_INVALID_TTL'])
+        return False
     elif response.status_code != 200:
         # Error while verifying token
         error = {"msg": response.text}
-        return Response(ErrorResponseSchema().dumps(error), status=response.status_code)
+        return Response(error_response_schema.dumps(error), status=response.status_code)
 
-    # Token is valid, save user id
     user_data = response.json()
-    g.user_id = user_data['id']
+    cache.set(cache_key, user_data['id'], current_app.config['TOKEN_CACHE_TTL'])
+    return user_data['id']
 
 
-@class_route(blp, "/posts", methods=['POST', 'GET'])
+@class_route(blp, "/posts", methods=['POST', 'GET', 'DELETE'])
 class PostsView(MethodView):
 
     def post(self):
         try:
-            # Extraer datos del request
-            route_id = request.json.get('routeId')
-            expire_at = request.json.get('expireAt')
-            created_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
-
-            # Organizar expireAt
-            expire_at = parser.parse(expire_at)
-            expire_at = expire_at.replace(tzinfo=timezone.utc)
-            expire_at = expire_at.replace(microsecond=0).isoformat()
-
-            # Validar el esquema de entrada
-            data = CreatePostSchema().load({
-                'routeId': route_id,
-                'userId': g.user_id,  # Se obtiene del token 'Authorization
-                'expireAt': expire_at,
-                'createdAt': created_at
-            })
+            # Extraer y validar el esquema de entrada (el userId se obtiene del token 'Authorization')
+            created_at = datetime.now(timezone.utc).replace(microsecond=0)
+            data = create_post_schema.load(prepare_post(request.json, g.user_id, created_at))
 
             # Verificar que la fecha de expiración sea mayor a la fecha de creación
             if data['expireAt'] <= data['createdAt']:
                 error = {"msg": "La fecha expiración no es válida"}
                 return jsonify(error), 412
 
+            # Con group commit la publicación se guarda junto con las de otras solicitudes concurrentes
+            committer = current_app.extensions.get('group_commit')
+            if committer is not None:
+                row = dict(data, id=str(uuid.uuid4()))
+                committer.submit(row)
+                response_data = {
+                    "id": row['id'],
+                    "userId": row['userId'],
+                    "createdAt": row['createdAt'].replace(tzinfo=None).isoformat(),
+                }
+                return respond(response_data, 201)
+
             # Crear el post
             new_post = Post(
                 id=str(uuid.uuid4()),
@@ -93,6 +303,7 @@ class PostsView(MethodView):
             )
             db.session.add(new_post)
             db.session.commit()
+            posts_created([(new_post.id, data['routeId'], data['userId'], data['expireAt'], data['createdAt'])])
 
             # Respuesta exitosa
             response_data = {
@@ -100,111 +311,399 @@ class PostsView(MethodView):
                 "userId": new_post.userId,
                 "createdAt": new_post.createdAt.isoformat(),
             }
-            return jsonify(response_data), 201
+            return respond(response_data, 201)
 
         except ValidationError as e:
             # Datos inválidos (400)
             error = {"msg": f"Datos invalidos, error(es): {e.messages}", "errors:": e.messages}
-            return Response(ErrorResponseSchema().dumps(error), status=400)
+            return Response(error_response_schema.dumps(error), status=400)
 
         except Exception as e:
             # Error interno (500)
             error_response = create_error_response(e)
             return jsonify(error_response), 500
 
+    @read_replica
     def get(self):
         # Validar que no se pasen parametros inesperados
-        valid_params = ['expire', 'route', 'owner']
+        valid_params = ['expire', 'route', 'owner', 'limit', 'cursor', 'stream', 'archived']
         if any(param not in valid_params for param in request.args):
             error = {"msg": "Solicitud contiene parámetros inesperados."}
-            return Response(ErrorResponseSchema().dumps(error), status=400)
-
-        # Extraer parámetros de la consulta
-        expire_filter = request.args.get('expire', type=str)
-        route_id = request.args.get('route', type=str)
-        owner = request.args.get('owner', type=str)
-
-        # Validar que el routeId sea un UUID válido
-        if route_id and not is_valid_uuid(route_id):
-            error = {"msg": "Valor inválido para el parámetro \'route\'."}
-            return Response(ErrorResponseSchema().dumps(error), status=400)
-
-        # Validar que el expire sea 'true' o 'false'
-        if expire_filter and expire_filter.lower() not in ['true', 'false']:
-            error = {"msg": "Valor inválido para el parámetro \'expire\'."}
-            return Response(ErrorResponseSchema().dumps(error), status=400)
-
-        # Iniciar la consulta
-        query = Post.query
-
-        # Filtrar por roiuteId si se proporciona
-        if route_id:
-            query = query.filter_by(routeId=route_id)
-
-        # Filtrar por userId si se proporciona
-        if owner:
-            if owner == 'me':
-                owner = g.user_id
-            query = query.filter_by(userId=owner)
-
-        # Filtrar por estado de expericacion si se proporciona
-        if expire_filter is not None:
-            if expire_filter.lower() == 'true':
-                query = query.filter(Post.expireAt < datetime.now(timezone.utc))
-            elif expire_filter.lower() == 'false':
-                query = query.filter(Post.expireAt >= datetime.now(timezone.utc))
+            return Response(error_response_schema.dumps(error), status=400)
+
+        # Extraer y validar los filtros de la consulta
+        try:
+            route_id, owner, expire_filter = filter_params()
+        except ValueError as e:
+            error = {"msg": f"Valor inválido para el parámetro \'{e}\'."}
+            return Response(error_response_schema.dumps(error), status=400)
+
+        # Validar que el archived sea 'true' o 'false'
+        archived = request.args.get('archived', type=str)
+        if archived and archived.lower() not in ['true', 'false']:
+            error = {"msg": "Valor inválido para el parámetro \'archived\'."}
+            return Response(error_response_schema.dumps(error), status=400)
+        archived = (archived or '').lower() == 'true'
+
+        # Validar el modo de respuesta: 'stream=true' o 'Accept: application/x-ndjson' envían los resultados por bloques
+        stream_filter = request.args.get('stream', type=str)
+        if stream_filter and stream_filter.lower() not in ['true', 'false']:
+            error = {"msg": "Valor inválido para el parámetro \'stream\'."}
+            return Response(error_response_schema.dumps(error), status=400)
+        ndjson = request.accept_mimetypes.best_match([JSON, NDJSON]) == NDJSON
+        stream = ndjson or (stream_filter or '').lower() == 'true'
+
+        # Validar los parámetros de paginación (solo se pagina si se envía 'limit' o 'cursor')
+        limit = request.args.get('limit', type=str)
+        cursor = request.args.get('cursor', type=str)
+        paginate = limit is not None or cursor is not None
+        if paginate:
+            if limit is None:
+                limit = current_app.config['POSTS_PAGE_SIZE']
+            elif not limit.isdigit() or int(limit) < 1:
+                error = {"msg": "Valor inválido para el parámetro \'limit\'."}
+                return Response(error_response_schema.dumps(error), status=400)
+            limit = min(int(limit), current_app.config['POSTS_PAGE_MAX'])
+
+            if cursor:
+                try:
+                    cursor = decode_cursor(cursor)
+                except ValueError:
+                    error = {"msg": "Valor inválido para el parámetro \'cursor\'."}
+                    return Response(error_response_schema.dumps(error), status=400)
+
+        # Solicitud condicional: si el ETag del cliente sigue vigente se responde 304 sin consultar las filas.
+        # Los listados por bloques filtrados por expire no llevan ETag (su vencimiento se conoce al final), ni los
+        # listados leídos de la réplica o con los marcadores de versión desactivados
+        streamed = stream and not paginate
+        mimetype = (NDJSON if ndjson else JSON) if streamed else response_mimetype()
+        digest = None if streamed and expire_filter else list_digest(route_id, owner, mimetype)
+        if digest and list_not_modified(digest):
+            return not_modified(list_etag(digest))
+
+        # Las publicaciones no expiradas por ruta y/o dueño se pueden responder desde el índice en memoria
+        if expire_filter and expire_filter.lower() == 'false' and not paginate and not stream:
+            posts = active_posts(route_id, owner)
+            if posts is not None:
+                response = respond([serialize_post(post) for post in posts], mimetype=mimetype)
+                if digest:
+                    response.set_etag(list_etag(digest, next_expiration(route_id, owner, expire_filter, posts)))
+                return response
+
+        # Iniciar la consulta (solo las columnas de la respuesta, sin objetos del ORM) con los filtros proporcionados
+        query = select(*POST_COLUMNS).where(*post_filters(Post, route_id, owner, expire_filter))
+
+        # Incluir las publicaciones archivadas por el reaper si se solicitan
+        if archived:
+            archive_query = select(*(getattr(PostArchive, column.key) for column in POST_COLUMNS)) \
+                .where(*post_filters(PostArchive, route_id, owner, expire_filter))
+            query = select(union_all(query, archive_query).subquery())
+        columns = query.selected_columns
+
+        # Paginar por keyset sobre (createdAt, id): el costo de cada página no depende de su posición
+        if paginate:
+            if cursor:
+                keys = (columns.createdAt, columns.id)
+                query = query.where(tuple_(*keys) > tuple_(*cursor, types=[key.type for key in keys]))
+            query = query.order_by(columns.createdAt, columns.id).limit(limit + 1)
+
+        # Las páginas ya están acotadas, por lo que solo se transmiten por bloques las consultas sin paginar
+        if streamed:
+            response = stream_posts(query, mimetype)
+            if digest:
+                response.set_etag(list_etag(digest))
+            return response
 
         # Ejecutar la consulta y obtener los resultados
-        posts = query.all()
+        posts = db.session.execute(query).all()
+
+        next_cursor = None
+        if paginate and len(posts) > limit:
+            posts = posts[:limit]
+            next_cursor = encode_cursor(posts[-1].createdAt, posts[-1].id)
 
         # Formatear y devolver los resultados
-        results = [{
-            "id": post.id,
-            "routeId": post.routeId,
-            "userId": post.userId,
-            "expireAt": post.expireAt.isoformat(),
-            "createdAt": post.createdAt.isoformat()
-        } for post in posts]
+        results = [serialize_post(post) for post in posts]
 
-        return jsonify(results), 200
+        response = respond(results, mimetype=mimetype)
+        if digest:
+            response.set_etag(list_etag(digest, next_expiration(route_id, owner, expire_filter, posts)))
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return response
+
+    def delete(self):
+        # Validar que no se pasen parametros inesperados
+        if any(param not in ['expire', 'route', 'owner'] for param in request.args):
+            error = {"msg": "Solicitud contiene parámetros inesperados."}
+            return Response(error_response_schema.dumps(error), status=400)
+
+        # Mismos filtros que GET /posts; se exige al menos uno para no eliminar todo por error
+        try:
+            route_id, owner, expire_filter = filter_params()
+        except ValueError as e:
+            error = {"msg": f"Valor inválido para el parámetro \'{e}\'."}
+            return Response(error_response_schema.dumps(error), status=400)
+        if not (route_id or owner or expire_filter):
+            error = {"msg": "Se requiere al menos uno de los filtros 'route', 'owner' o 'expire'."}
+            return Response(error_response_schema.dumps(error), status=400)
+
+        # Solo se eliminan publicaciones del usuario del token, cualquiera sea el filtro
+        user_id = g.user_id.lower()
+        if owner and owner != user_id:
+            error = {"msg": "Solo se pueden eliminar publicaciones propias."}
+            return Response(error_response_schema.dumps(error), status=403)
+
+        # Eliminar por bloques de POSTS_DELETE_BATCH filas, con una transacción corta por bloque
+        batch_size = current_app.config['POSTS_DELETE_BATCH']
+        conditions = post_filters(Post, route_id, user_id, expire_filter)
+        deleted = 0
+        while True:
+            ids = select(Post.id).where(*conditions).limit(batch_size).scalar_subquery()
+            count = delete_posts(Post.id.in_(ids))
+            deleted += count
+            if count < batch_size:
+                break
+
+        return respond({"msg": "Las publicaciones fueron eliminadas", "deleted": deleted})
+
+
+@class_route(blp, "/posts/batch", methods=['POST'])
+class PostsBatchView(MethodView):
+    init_every_request = False
+
+    def post(self):
+        # Validar que el cuerpo sea un arreglo de publicaciones dentro del tamaño máximo del lote
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, list) or not payload:
+            error = {"msg": "Se esperaba un arreglo de publicaciones."}
+            return Response(error_response_schema.dumps(error), status=400)
+
+        batch_max = current_app.config['POSTS_BATCH_MAX']
+        if len(payload) > batch_max:
+            error = {"msg": f"El lote supera el máximo de {batch_max} publicaciones."}
+            return Response(error_response_schema.dumps(error), status=413)
+
+        # Organizar cada publicación; los errores se reportan por elemento como en la creación individual
+        created_at = datetime.now(timezone.utc).replace(microsecond=0)
+        results = [None] * len(payload)
+        prepared = []
+        for index, item in enumerate(payload):
+            try:
+                prepared.append((index, prepare_post(item, g.user_id, created_at)))
+            except Exception as e:
+                results[index] = (500, {"msg": str(e)})
+
+        # Validar todo el lote en una sola pasada
+        try:
+            loaded = create_posts_schema.load([data for _, data in prepared])
+            errors = {}
+        except ValidationError as e:
+            loaded, errors = e.valid_data, e.messages
+
+        rows = []
+        for position, ((index, _), data) in enumerate(zip(prepared, loaded)):
+            if position in errors:
+                messages = errors[position]
+                results[index] = (400, {"msg": f"Datos invalidos, error(es): {messages}", "errors:": messages})
+            elif data['expireAt'] <= data['createdAt']:
+                results[index] = (412, {"msg": "La fecha expiración no es válida"})
+            else:
+                row = dict(data, id=str(uuid.uuid4()))
+                rows.append(row)
+                # Mismo formato que la respuesta de la creación individual
+                results[index] = (201, {
+                    "id": row['id'],
+                    "userId": row['userId'],
+                    "createdAt": row['createdAt'].replace(tzinfo=None).isoformat(),
+                })
+
+        # Insertar todas las publicaciones válidas con un único INSERT de varias filas en una transacción
+        if rows:
+            try:
+                insert_posts(rows)
+            except Exception as e:
+                for index, (status, _) in enumerate(results):
+                    if status == 201:
+                        results[index] = (500, {"msg": str(e)})
+
+        statuses = {status for status, _ in results}
+        response = [{"status": status, "body": body} for status, body in results]
+        return respond(response, 201 if statuses == {201} else 207)
+
+
+@class_route(blp, "/posts/stats", methods=['GET'])
+class PostsStatsView(MethodView):
+    init_every_request = False
+
+    @read_replica
+    def get(self):
+        # Validar que no se pasen parametros inesperados
+        valid_params = ['expire', 'route', 'owner', 'group', 'bucket', 'limit']
+        if any(param not in valid_params for param in request.args):
+            error = {"msg": "Solicitud contiene parámetros inesperados."}
+            return Response(error_response_schema.dumps(error), status=400)
+
+        # Mismos filtros que GET /posts
+        try:
+            route_id, owner, expire_filter = filter_params()
+        except ValueError as e:
+            error = {"msg": f"Valor inválido para el parámetro \'{e}\'."}
+            return Response(error_response_schema.dumps(error), status=400)
+
+        # Agrupación por ruta o dueño, intervalos de creación y número máximo de grupos o intervalos
+        group = request.args.get('group', type=str)
+        if group and group not in STATS_GROUPS:
+            error = {"msg": "Valor inválido para el parámetro \'group\'."}
+            return Response(error_response_schema.dumps(error), status=400)
+        bucket = request.args.get('bucket', type=str)
+        if bucket and bucket not in STATS_BUCKETS:
+            error = {"msg": "Valor inválido para el parámetro \'bucket\'."}
+            return Response(error_response_schema.dumps(error), status=400)
+        limit = request.args.get('limit', type=str)
+        if limit is not None and (not limit.isdigit() or int(limit) < 1):
+            error = {"msg": "Valor inválido para el parámetro \'limit\'."}
+            return Response(error_response_schema.dumps(error), status=400)
+        limit = min(int(limit or current_app.config['STATS_LIMIT']), current_app.config['STATS_LIMIT_MAX'])
+
+        # Conteos calculados en la base de datos: la respuesta tiene a lo sumo 'limit' grupos o intervalos
+        conditions = post_filters(Post, route_id, owner, expire_filter)
+        now = datetime.now(timezone.utc)
+        active = func.coalesce(func.sum(case((Post.expireAt >= now, 1), else_=0)), 0)
+        counts = (func.count().label('total'), active.label('active'))
+
+        total, active_total = db.session.execute(select(*counts).where(*conditions)).one()
+        result = {"total": total, "active": active_total, "expired": total - active_total}
+
+        if group:
+            column = getattr(Post, STATS_GROUPS[group])
+            rows = db.session.execute(
+                select(column, *counts).where(*conditions).group_by(column)
+                .order_by(literal_column('total').desc(), column).limit(limit)).all()
+            result['groups'] = [
+                {STATS_GROUPS[group]: key, "total": count, "active": active_count, "expired": count - active_count}
+                for key, count, active_count in rows
+            ]
+
+        if bucket:
+            start = created_bucket(bucket).label('start')
+            rows = db.session.execute(
+                select(start, func.count()).where(*conditions).group_by(start)
+                .order_by(start.desc()).limit(limit)).all()
+            result['buckets'] = [
+                {"start": key if isinstance(key, str) else key.isoformat(), "count": count}
+                for key, count in reversed(rows)
+            ]
+
+        return respond(result)
+
+
+@class_route(blp, "/posts/lookup", methods=['POST'])
+class PostsLookupView(MethodView):
+    init_every_request = False
+
+    @read_replica
+    def post(self):
+        # Validar que el cuerpo tenga un arreglo de ids dentro del tamaño máximo
+        payload = request.get_json(silent=True)
+        ids = payload.get('ids') if isinstance(payload, dict) else None
+        if not isinstance(ids, list) or not ids:
+            error = {"msg": "Se esperaba un arreglo 'ids' de publicaciones."}
+            return Response(error_response_schema.dumps(error), status=400)
+
+        lookup_max = current_app.config['POSTS_LOOKUP_MAX']
+        if len(ids) > lookup_max:
+            error = {"msg": f"La consulta supera el máximo de {lookup_max} publicaciones."}
+            return Response(error_response_schema.dumps(error), status=413)
+
+        invalid = [id for id in ids if not is_valid_uuid(id)]
+        if invalid:
+            error = {"msg": f"Valores inválidos en \'ids\': {invalid}"}
+            return Response(error_response_schema.dumps(error), status=400)
+        ids = list(dict.fromkeys(id.lower() for id in ids))
+
+        # Primero la caché de publicaciones; las demás se consultan con IN por bloques
+        cache = current_app.extensions['post_cache']
+        found = {}
+        pending = []
+        for id in ids:
+            result = None if wants_primary() else cache.get(id)
+            if result is None:
+                pending.append(id)
+            elif result is not False:
+                found[id] = result
+
+        chunk_size = current_app.config['POSTS_LOOKUP_CHUNK']
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            for post in db.session.execute(select(*POST_COLUMNS).where(Post.id.in_(chunk))):
+                found[post.id] = serialize_post(post)
+                cache.set(post.id, found[post.id], post_cache_ttl(post.expireAt))
+            # Un id ausente en una réplica atrasada puede existir en el primario: solo se recuerdan los 404 del primario
+            if not reading_replica():
+                for id in chunk:
+                    if id not in found:
+                        cache.set(id, False, current_app.config['POST_CACHE_MISS_TTL'])
+
+        # Publicaciones encontradas en el orden de la solicitud y los ids inexistentes
+        return respond({
+            "posts": [found[id] for id in ids if id in found],
+            "missing": [id for id in ids if id not in found],
+        })
 
 
 @class_route(blp, "/posts/<string:id>", methods=['GET', 'DELETE'])
 class PostView(MethodView):
 
+    @read_replica
     def get(self, id): # Error con el 404
         # Validar que el id sea un UUID válido
         if not is_valid_uuid(id):
             error = {"msg": "Valor inválido para el parámetro \'id\'."}
-            return Response(ErrorResponseSchema().dumps(error), status=400)
-
-        # Buscar el post
-        post = Post.query.get_or_404(id, description="Publicación no encontrada.")
+            return Response(error_response_schema.dumps(error), status=400)
+        id = id.lower()
+
+        # Buscar el post, primero en la caché (las publicaciones no cambian después de creadas). Si el cliente
+        # pide leer sus propias escrituras se omite la caché, que pudo guardar un 404 leído de una réplica atrasada
+        cache = current_app.extensions['post_cache']
+        result = None if wants_primary() else cache.get(id)
+        if result is None:
+            post = db.session.execute(select(*POST_COLUMNS).where(Post.id == id)).first()
+            if post is None:
+                # Recordar el 404 por un tiempo corto para que las consultas repetidas no lleguen a la base de datos,
+                # salvo si se leyó de la réplica: la publicación pudo crearse y aún no haberse replicado
+                if not reading_replica():
+                    cache.set(id, False, current_app.config['POST_CACHE_MISS_TTL'])
+                abort(404, description="Publicación no encontrada.")
+
+            result = serialize_post(post)
+            cache.set(id, result, post_cache_ttl(post.expireAt))
+
+        if result is False:
+            abort(404, description="Publicación no encontrada.")
+
+        # Las publicaciones no cambian después de creadas: el id (y el formato) identifican la representación
+        etag = post_etag(id, response_mimetype())
+        if request.if_none_match.contains_weak(etag) or request.if_none_match.star_tag:
+            return not_modified(etag)
 
         # Si la publicación existe, retornarla
-        result = {
-            "id": post.id,
-            "routeId": post.routeId,
-            "userId": post.userId,
-            "expireAt": post.expireAt.isoformat(),
-            "createdAt": post.createdAt.isoformat()
-        }
-        return jsonify(result), 200
+        response = respond(result)
+        response.set_etag(etag)
+        return response
 
     def delete(self, id):
         # Validar que el id sea un UUID válido
         if not is_valid_uuid(id):
             error = {"msg": "Valor inválido para el parámetro \'id\'."}
-            return Response(ErrorResponseSchema().dumps(error), status=400)
+            return Response(error_response_schema.dumps(error), status=400)
+        id = id.lower()
 
-        # Buscar el post
-        post = Post.query.get_or_404(id, description="Publicación no encontrada.")
-
-        # Eliminar la publicación
-        db.session.delete(post)
-        db.session.commit()
+        # Eliminar la publicación con un único DELETE; si no eliminó ninguna fila, la publicación no existe
+        if not delete_posts(Post.id == id):
+            abort(404, description="Publicación no encontrada.")
 
         # Respuesta exitosa
         response = {"msg": "la publicación fue eliminada"}
-        return jsonify(response), 200
+        return respond(response)
 
@@ -1,19 +1,61 @@
-from flask import Blueprint, Response
+from flask import Blueprint, Response, current_app
 from flask.views import MethodView
-from .schemas.post_schemas import ResetPostsResponseSchema
-from models import Post
+from sqlalchemy import delete, select, text
+from sqlalchemy.exc import DBAPIError
+from .schemas.post_schemas import reset_posts_response_schema
+from models import Post, PostArchive
+from .invalidation import posts_cleared
 from .util import class_route
 from db import db
 
 blp = Blueprint("Reset Database", __name__)
 
 
+def truncate_tables(models):
+    """
+    Vacía las tablas con TRUNCATE (solo Postgres). Retorna False si no es posible hacerlo.
+    """
+    if db.engine.dialect.name != 'postgresql' or not current_app.config['RESET_TRUNCATE']:
+        return False
+
+    tables = ', '.join(f'"{model.__tablename__}"' for model in models)
+    try:
+        db.session.execute(text(f'TRUNCATE TABLE {tables}'))
+        db.session.commit()
+    except DBAPIError:
+        # Por ejemplo, el usuario de la base de datos no tiene permiso de TRUNCATE
+        db.session.rollback()
+        current_app.logger.warning('Reset: TRUNCATE no permitido, se eliminará por bloques')
+        return False
+    return True
+
+
+def delete_in_chunks(model, chunk_size):
+    """
+    Elimina todas las filas de la tabla en bloques de chunk_size con un commit por bloque,
+    reportando el avance en el log. Retorna el número de filas eliminadas.
+    """
+    deleted = 0
+    while True:
+        ids = select(model.id).limit(chunk_size).scalar_subquery()
+        count = db.session.execute(delete(model).where(model.id.in_(ids))).rowcount
+        db.session.commit()
+        if not count:
+            return deleted
+
+        deleted += count
+        current_app.logger.info('Reset: %s filas eliminadas de %s', deleted, model.__tablename__)
+
+
 @class_route(blp, "/posts/reset")
 class PostReset(MethodView):
     init_every_request = False
 
     def post(self):
-        db.session.query(Post).delete()
-        db.session.commit()
+        models = [Post, PostArchive]
+        if not truncate_tables(models):
+            for model in models:
+                delete_in_chunks(model, current_app.config['RESET_CHUNK_SIZE'])
+        posts_cleared()
         response_data = {"msg": "Todos los datos fueron eliminados"}
-        return Response(ResetPostsResponseSchema().dumps(response_data), status=200, mimetype='application/json')
\ No newline at end of file
+        return Response(reset_posts_response_schema.dumps(response_data), status=200, mimetype='application/json')
@@ -1,11 +1,36 @@
-from marshmallow import Schema, fields
+from datetime import datetime
+from marshmallow import Schema, ValidationError, fields
+from models import is_valid_uuid
+
+
+class DateTimeField(fields.DateTime):
+    """
+    DateTime que acepta directamente objetos datetime, evitando convertirlos a cadena para volver a leerlos.
+    """
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if isinstance(value, datetime):
+            return value
+        return super()._deserialize(value, attr, data, **kwargs)
+
+
+class UUIDField(fields.Str):
+    """
+    UUID en formato de cadena, normalizado a minúsculas como se guarda y se devuelve en las respuestas.
+    """
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        value = super()._deserialize(value, attr, data, **kwargs)
+        if not is_valid_uuid(value):
+            raise ValidationError('No es un UUID válido.')
+        return value.lower()
 
 
 class CreatePostSchema(Schema):
-    routeId = fields.Str(required=True)
-    userId = fields.Str(required=True)
-    expireAt = fields.DateTime(required=True)
-    createdAt = fields.DateTime(required=True)
+    routeId = UUIDField(required=True)
+    userId = UUIDField(required=True)
+    expireAt = DateTimeField(required=True)
+    createdAt = DateTimeField(required=True)
 
 
 class ErrorResponseSchema(Schema):
@@ -15,3 +40,10 @@ class ErrorResponseSchema(Schema):
 
 class ResetPostsResponseSchema(Schema):
     msg = fields.String()
+
+
+# Los esquemas se construyen una sola vez y se reutilizan en cada solicitud
+create_post_schema = CreatePostSchema()
+create_posts_schema = CreatePostSchema(many=True)
+error_response_schema = ErrorResponseSchema()
+reset_posts_response_schema = ResetPostsResponseSchema()
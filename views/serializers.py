@@ -0,0 +1,19 @@
+from models import Post
+
+# Columnas de las respuestas de publicaciones; las vistas de lectura las consultan como tuplas
+# (select(*POST_COLUMNS)) sin construir objetos del ORM
+POST_COLUMNS = (Post.id, Post.routeId, Post.userId, Post.expireAt, Post.createdAt)
+
+
+def serialize_post(row):
+    """
+    Convierte una fila con las columnas de POST_COLUMNS en el diccionario que se devuelve en las respuestas.
+    """
+    id, route_id, user_id, expire_at, created_at = row
+    return {
+        "id": id,
+        "routeId": route_id,
+        "userId": user_id,
+        "expireAt": expire_at.isoformat(),
+        "createdAt": created_at.isoformat()
+    }
@@ -1,6 +1,12 @@
+import base64
+import binascii
 import json
-from .schemas.post_schemas import ErrorResponseSchema
+from datetime import datetime
+from functools import wraps
+from flask import g, request
+from .schemas.post_schemas import error_response_schema
 from marshmallow import ValidationError
+from models import is_valid_uuid
 
 
 def class_route(self, rule, **options):
@@ -11,11 +17,63 @@ def class_route(self, rule, **options):
     return decorator
 
 
+def wants_primary():
+    """
+    Indica si el cliente pidió leer sus propias escrituras (encabezado X-Consistency: strong).
+    """
+    return request.headers.get('X-Consistency', '').lower() == 'strong'
+
+
+def read_replica(view):
+    """
+    Envía las consultas de la vista a la réplica de lectura (si está configurada), salvo que el
+    cliente pida leer del primario con wants_primary.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.db_replica = not wants_primary()
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
 def create_error_response(message):
     if isinstance(message, ValidationError):
         error = {"msg": message.normalized_messages()}
     else:
         error = {"msg": message}
-    return ErrorResponseSchema().dumps(error)
+    return error_response_schema.dumps(error)
+
+
+def encode_cursor(created_at, id):
+    """
+    Codifica la posición (createdAt, id) de la última fila de una página como un cursor opaco.
+    """
+    payload = json.dumps([created_at.isoformat(), id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decodifica un cursor generado por encode_cursor. Lanza ValueError si el cursor no es válido.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        if not is_valid_uuid(id):
+            raise ValueError(id)
+        return datetime.fromisoformat(created_at), id.lower()
+    except (binascii.Error, TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError('Cursor inválido') from e
 
 
+def parse_datetime(value):
+    """
+    Lee una fecha en formato ISO 8601 con datetime.fromisoformat y solo recurre al parser
+    general de dateutil cuando el formato no es estándar (los errores son los de dateutil).
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        from dateutil import parser
+        return parser.parse(value)